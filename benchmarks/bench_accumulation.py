@@ -0,0 +1,93 @@
+"""
+Compares the old float accumulation with the exact modes for speed and accuracy.
+
+- taskD/taskE: adding every Wh sample as float kWh vs. summing integer Wh
+  with PhaseColumns and converting once
+- taskF: adding floats one by one vs. exact_sum (fsum rounded to the file's decimals)
+
+Run from the repository root:
+    python benchmarks/bench_accumulation.py [--years 10]
+"""
+
+import argparse
+import random
+import time
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+from tasks import ROOT, load_task
+
+
+def timed(function, *args):
+    """Returns (result, seconds) of one call."""
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def phase_rows(hours: int) -> list:
+    """Synthetic taskD/taskE rows with random Wh readings for every hour."""
+    rng = random.Random(42)
+    start = datetime(2020, 1, 1)
+    return [
+        [start + timedelta(hours=h), *(rng.randrange(0, 2000) for _ in range(6))]
+        for h in range(hours)
+    ]
+
+
+def float_phase_sum(rows: list) -> list:
+    """The old path: one float division and addition per sample."""
+    totals = [0, 0, 0, 0, 0, 0]
+    for per_hour in rows:
+        for i in range(6):
+            totals[i] += per_hour[i + 1] / 1000
+    return totals
+
+
+def bench_phases(years: int) -> None:
+    task_d = load_task("taskD")
+    rows = phase_rows(years * 8760)
+    exact = [sum(per_hour[i + 1] for per_hour in rows) for i in range(6)]
+
+    old, old_time = timed(float_phase_sum, rows)
+
+    def integer_sum(columns):
+        return [sum(columns.values[i::6]) / 1000 for i in range(6)]
+
+    columns, build_time = timed(task_d.PhaseColumns, rows)
+    new, new_time = timed(integer_sum, columns)
+    print(f"Phases, {len(rows)} hours")
+    print(f"  float per sample: {old_time:8.3f} s  max error {max(abs(o - e / 1000) for o, e in zip(old, exact)):.3e} kWh")
+    print(f"  integer Wh:       {new_time:8.3f} s  max error {max(abs(n - e / 1000) for n, e in zip(new, exact)):.3e} kWh"
+          f"  (+ {build_time:.3f} s to build PhaseColumns)")
+
+
+def bench_yearly(years: int) -> None:
+    task_f = load_task("taskF")
+    one_year = task_f.read_data(str(ROOT / "taskF" / "2025.csv"))
+    values = [per_hour[1] for per_hour in one_year] * years
+    exact = float(sum(Decimal(repr(value)) for value in values))
+
+    def naive(values):
+        total = 0.0
+        for value in values:
+            total += value
+        return total
+
+    old, old_time = timed(naive, values)
+    new, new_time = timed(task_f.exact_sum, values)
+    print(f"Consumption, {len(values)} hours")
+    print(f"  naive float:      {old_time:8.3f} s  error {abs(old - exact):.3e} kWh")
+    print(f"  exact_sum:        {new_time:8.3f} s  error {abs(new - exact):.3e} kWh")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--years", type=int, default=10, help="years of hourly data to sum")
+    args = parser.parse_args()
+    bench_phases(args.years)
+    bench_yearly(args.years)
+
+
+if __name__ == "__main__":
+    main()
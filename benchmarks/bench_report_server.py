@@ -0,0 +1,109 @@
+"""
+Load test of taskF/report_server.py: requests per second and latency
+percentiles of concurrent keep-alive clients asking random reports.
+
+Run from the repository root (starts its own server unless --url is given):
+    python benchmarks/bench_report_server.py [--clients 50] [--requests 20000]
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+import time
+from datetime import date, timedelta
+from urllib.parse import urlsplit
+
+from tasks import ROOT
+
+
+def random_targets(count: int, seed: int = 1) -> list[str]:
+    """A deterministic mix of daily ranges, months and years of 2025."""
+    rng = random.Random(seed)
+    first = date(2025, 1, 1).toordinal()
+    targets = []
+    for _ in range(count):
+        kind = rng.random()
+        if kind < 0.7:
+            start = date.fromordinal(first + rng.randrange(365))
+            end = min(start + timedelta(days=rng.randrange(60)), date(2025, 12, 31))
+            targets.append(f"/daily?start={start:%d.%m.%Y}&end={end:%d.%m.%Y}")
+        elif kind < 0.95:
+            targets.append(f"/monthly?month={rng.randrange(1, 13)}")
+        else:
+            targets.append("/yearly")
+    return targets
+
+
+async def client(host: str, port: int, targets: list[str], latencies: list[float], errors: list[int]) -> None:
+    """Sends the targets one after another over one keep-alive connection."""
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for target in targets:
+            start = time.perf_counter()
+            writer.write(f"GET {target} HTTP/1.1\r\nHost: {host}\r\n\r\n".encode("latin-1"))
+            status = int((await reader.readline()).split()[1])
+            length = 0
+            while (line := await reader.readline()).strip():
+                name, _, value = line.decode("latin-1").partition(":")
+                if name.lower() == "content-length":
+                    length = int(value)
+            await reader.readexactly(length)
+            latencies.append(time.perf_counter() - start)
+            if status != 200:
+                errors.append(status)
+    finally:
+        writer.close()
+
+
+async def load_test(host: str, port: int, clients: int, requests: int) -> None:
+    targets = random_targets(requests)
+    latencies = []
+    errors = []
+    start = time.perf_counter()
+    await asyncio.gather(*(client(host, port, targets[i::clients], latencies, errors) for i in range(clients)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    percentile = lambda p: latencies[min(len(latencies) - 1, int(p / 100 * len(latencies)))] * 1000
+    print(f"{len(latencies)} requests, {clients} clients, {len(errors)} errors")
+    print(f"  throughput: {len(latencies) / elapsed:10,.0f} req/s")
+    print(f"  latency:    p50 {percentile(50):.2f} ms  p99 {percentile(99):.2f} ms  "
+          f"max {latencies[-1] * 1000:.2f} ms  mean {statistics.fmean(latencies) * 1000:.2f} ms")
+
+
+async def start_server() -> tuple[asyncio.subprocess.Process, str, int]:
+    """Starts report_server.py on a free port in its own process."""
+    process = await asyncio.create_subprocess_exec(
+        sys.executable, str(ROOT / "taskF" / "report_server.py"), "--port", "0",
+        stdout=asyncio.subprocess.PIPE,
+    )
+    line = (await process.stdout.readline()).decode()
+    url = urlsplit(line.split()[-1])
+    return process, url.hostname, url.port
+
+
+async def main_async(args) -> None:
+    if args.url:
+        url = urlsplit(args.url)
+        await load_test(url.hostname, url.port, args.clients, args.requests)
+        return
+    process, host, port = await start_server()
+    try:
+        await load_test(host, port, args.clients, args.requests)
+    finally:
+        process.terminate()
+        await process.wait()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--clients", type=int, default=50, help="concurrent connections")
+    parser.add_argument("--requests", type=int, default=20_000, help="requests in total")
+    parser.add_argument("--url", help="test a running server, e.g. http://127.0.0.1:8080")
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
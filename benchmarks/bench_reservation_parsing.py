@@ -0,0 +1,67 @@
+"""
+Rows per second of the reservation converters before (datetime.strptime)
+and after (reservation_parsing / fromisoformat with cached dates).
+
+Run from the repository root:
+    python benchmarks/bench_reservation_parsing.py [--rows 1000000]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from datetime import datetime
+
+from generators import write_reservations
+from tasks import load_task
+
+
+def strptime_fields(data: list) -> tuple:
+    """The three strptime calls every converter used to make per row."""
+    return (
+        datetime.strptime(data[4], "%Y-%m-%d").date(),
+        datetime.strptime(data[5], "%H:%M").time(),
+        datetime.strptime(data[10].strip(), "%Y-%m-%d %H:%M:%S"),
+    )
+
+
+def rows_per_second(convert, lines: list) -> float:
+    start = time.perf_counter()
+    for fields in lines:
+        convert(fields)
+    return len(lines) / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=1_000_000, help="rows in the generated reservations.txt")
+    args = parser.parse_args()
+
+    task_c = load_task("taskC")
+    task_g = load_task("taskG_class")
+    task_g_dict = load_task("taskG_dict")
+    parsing = __import__("reservation_parsing")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "reservations.txt")
+        write_reservations(path, args.rows)
+        with open(path, encoding="utf-8") as f:
+            lines = [line.split("|") for line in f]
+
+    def fast_fields(data):
+        return parsing.parse_date(data[4]), parsing.parse_time(data[5]), parsing.parse_datetime(data[10])
+
+    results = [
+        ("date/time fields, strptime", rows_per_second(strptime_fields, lines)),
+        ("date/time fields, fast parser", rows_per_second(fast_fields, lines)),
+        ("taskC convert_reservation_data", rows_per_second(task_c.convert_reservation_data, lines)),
+        ("taskG Reservation", rows_per_second(task_g.Reservation, lines)),
+        ("taskG convert_reservation", rows_per_second(task_g_dict.convert_reservation, lines)),
+    ]
+    print(f"{len(lines)} rows")
+    for label, rate in results:
+        print(f"  {label:<32} {rate:12,.0f} rows/s")
+
+
+if __name__ == "__main__":
+    main()
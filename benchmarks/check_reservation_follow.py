@@ -0,0 +1,132 @@
+"""
+Checks taskG/reservation_follow.py against a real writer process.
+
+A child process appends generated reservations to a file in random chunks
+that split lines (and multi-byte characters) anywhere, with duplicate ids
+and malformed lines mixed in. The follower polls the file while it grows.
+At the end its collection must match one built from the clean records,
+and every injected bad line must have been skipped.
+
+Run from the repository root:
+    python benchmarks/check_reservation_follow.py [--rows 20000]
+"""
+
+import argparse
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+from generators import write_reservations
+from tasks import load_task
+
+
+def records(rows: int, bad_every: int) -> tuple[list[str], list[str], int]:
+    """
+    Generated reservation lines with bad lines mixed in.
+
+    Parameters:
+     rows (int): Valid reservations
+     bad_every (int): A duplicate and a malformed line after every this many records
+
+    Returns:
+     (tuple): clean lines, lines to write, number of bad lines among them
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "reservations.txt")
+        write_reservations(path, rows)
+        with open(path, encoding="utf-8") as f:
+            # Some names with a two-byte character, so chunks also split characters
+            clean = [line.replace("|Sniff ", "|Sniffä ", 1) for line in f.read().split("\n")]
+
+    written = []
+    bad = 0
+    # The last record stays last: the file has no newline after it
+    for number, line in enumerate(clean[:-1], 1):
+        written.append(line)
+        if number % bad_every == 0:
+            written.append(clean[number // 2])
+            written.append(f"{line.split('|')[0]}x|broken")
+            bad += 2
+    written.append(clean[-1])
+    return clean, written, bad
+
+
+def write_slowly(path: str, content: bytes, seed: int) -> None:
+    """Writer process: appends content in random chunks with short pauses."""
+    rng = random.Random(seed)
+    with open(path, "ab") as f:
+        position = 0
+        while position < len(content):
+            size = rng.randrange(1, 4096)
+            f.write(content[position:position + size])
+            f.flush()
+            position += size
+            time.sleep(rng.random() / 1000)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=20_000, help="valid reservations to write")
+    parser.add_argument("--bad-every", type=int, default=500, help="inject bad lines after every N records")
+    parser.add_argument("--seed", type=int, default=1, help="seed of the chunk sizes")
+    parser.add_argument("--write", nargs=2, metavar=("SOURCE", "TARGET"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.write:
+        with open(args.write[0], "rb") as f:
+            write_slowly(args.write[1], f.read(), args.seed)
+        return
+
+    task_g = load_task("taskG_class")
+    from reservation_collection import ReservationCollection
+    from reservation_follow import ReservationFollower
+
+    clean, written, bad = records(args.rows, args.bad_every)
+    expected = ReservationCollection(task_g.Reservation(line.split("|")) for line in clean)
+
+    with tempfile.TemporaryDirectory() as directory:
+        source = os.path.join(directory, "source.txt")
+        target = os.path.join(directory, "reservations.txt")
+        with open(source, "w", encoding="utf-8") as f:
+            f.write("\n".join(written))
+        open(target, "wb").close()
+
+        errors = []
+        follower = ReservationFollower(target, on_error=lambda line, error: errors.append(error))
+        writer = subprocess.Popen(
+            [sys.executable, __file__, "--write", source, target, "--seed", str(args.seed)]
+        )
+        polls = 0
+        start = time.perf_counter()
+        while writer.poll() is None:
+            follower.poll()
+            polls += 1
+        follower.poll()
+        elapsed = time.perf_counter() - start
+
+    got = follower.collection
+    checks = {
+        "reservations": (len(got), len(expected)),
+        "confirmed": (got.confirmed_count, expected.confirmed_count),
+        "unconfirmed": (got.unconfirmed_count, expected.unconfirmed_count),
+        "revenue cents": (got.confirmed_cents, expected.confirmed_cents),
+        "revenue per resource": (got.resource_cents, expected.resource_cents),
+        "skipped lines": (follower.skipped, bad),
+        "reported errors": (len(errors), bad),
+        "pending bytes": (len(follower.pending), 0),
+    }
+    failed = [name for name, (actual, wanted) in checks.items() if actual != wanted]
+    print(f"{len(got)} reservations, {follower.skipped} skipped lines, {polls} polls in {elapsed:.2f} s")
+    for name in failed:
+        actual, wanted = checks[name]
+        print(f"  MISMATCH {name}: {actual} != {wanted}")
+    if failed:
+        sys.exit(1)
+    print("ok")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Deterministic synthetic inputs in the same formats as the task data files.
+The same seed and size always give the same file.
+"""
+
+import random
+from datetime import date, datetime, timedelta
+
+FIRST_NAMES = ["Moomin", "Snork", "Little My", "Sniff", "Hemulen", "Snufkin", "Too-ticky", "Stinky"]
+LAST_NAMES = ["Valley", "Maiden", "Storm", "Moneywise", "Collector", "Wanderer", "Fisher", "Groke"]
+RESOURCES = ["Forest Area 1", "Flower Room", "Red Room", "Storage Area N", "Botanical Lab", "Meeting Room A"]
+
+
+def write_reservations(path, rows: int, seed: int = 1) -> None:
+    """
+    Writes a pipe-delimited reservations.txt like taskC/taskG use.
+
+    Parameters:
+     path: Output file
+     rows (int): Number of reservations
+     seed (int): Random seed
+    """
+    rng = random.Random(seed)
+    first_day = date(2025, 1, 1).toordinal()
+    first_created = datetime(2024, 6, 1)
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(rows):
+            name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+            email = f"{name.lower().replace(' ', '.')}{i}@example.com"
+            phone = f"04{rng.randrange(10 ** 8):08d}"
+            day = date.fromordinal(first_day + rng.randrange(365))
+            start = f"{rng.randrange(7, 20):02d}:{rng.choice((0, 15, 30, 45)):02d}"
+            duration = rng.randrange(1, 6)
+            price = rng.randrange(500, 5000) / 100
+            confirmed = rng.random() < 0.6
+            resource = rng.choice(RESOURCES)
+            created = first_created + timedelta(seconds=rng.randrange(365 * 86400))
+            line = (
+                f"{1000 + i}|{name}|{email}|{phone}|{day.isoformat()}|{start}|{duration}|"
+                f"{price:.2f}|{confirmed}|{resource}|{created:%Y-%m-%d %H:%M:%S}"
+            )
+            f.write(line if i == 0 else "\n" + line)
+
+
+def write_weekly_phases(path, hours: int, seed: int = 1, start: datetime = datetime(2025, 10, 6)) -> None:
+    """
+    Writes a semicolon-separated hourly phase CSV like the taskD/taskE week files.
+
+    Parameters:
+     path: Output file
+     hours (int): Number of hourly rows
+     seed (int): Random seed
+     start (datetime): Timestamp of the first row
+    """
+    rng = random.Random(seed)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(
+            "Time;Consumption phase 1 Wh;Consumption phase 2 Wh;Consumption phase 3 Wh;"
+            "Production phase 1 Wh;Production phase 2 Wh;Production phase 3 Wh"
+        )
+        for h in range(hours):
+            timestamp = start + timedelta(hours=h)
+            daylight = 8 <= timestamp.hour <= 17
+            consumption = [rng.randrange(20, 800) for _ in range(3)]
+            production = [rng.randrange(0, 600) if daylight else 0 for _ in range(3)]
+            values = ";".join(str(value) for value in consumption + production)
+            f.write(f"\n{timestamp.isoformat()};{values}")
+
+
+def write_yearly_energy(path, hours: int, seed: int = 1, start: datetime = datetime(2025, 1, 1)) -> None:
+    """
+    Writes a semicolon-separated, decimal-comma hourly CSV like taskF/2025.csv.
+
+    Parameters:
+     path: Output file
+     hours (int): Number of hourly rows
+     seed (int): Random seed
+     start (datetime): Local timestamp of the first row
+    """
+    rng = random.Random(seed)
+    temperature = 0.0
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("Time; Consumption (net) kWh; Production (net) kWh; Daily average temperature")
+        for h in range(hours):
+            timestamp = start + timedelta(hours=h)
+            if timestamp.hour == 0:
+                temperature = round(rng.uniform(-20, 25), 1)
+            consumption = f"{rng.uniform(0.1, 4):.3f}".replace(".", ",")
+            production = f"{rng.uniform(0, 3) if 8 <= timestamp.hour <= 17 else 0:.3f}".replace(".", ",")
+            f.write(f"\n{timestamp.isoformat()}.000+02:00;{consumption};{production};{str(temperature).replace('.', ',')}")
@@ -0,0 +1,78 @@
+# Copyright (c) 2026 Ville Heikkiniemi, Luka Hietala, Luukas Kola
+#
+# This code is licensed under the MIT License.
+# You are free to use, modify, and distribute this code,
+# provided that the original copyright notice is retained.
+#
+# See LICENSE file in the project root for full license information.
+
+"""
+Zero-copy scanning of delimited files through mmap
+
+Instead of decoding every line to str and splitting it into all of its
+fields, the file is memory-mapped and a compiled pattern walks the raw
+bytes. Only the fields that are asked for are cut out (as bytes), and
+the caller decodes just those. The confirmation summary, for example,
+touches field 8 only and never decodes names or emails.
+
+Works for the pipe-separated reservations.txt as well as the
+semicolon-separated energy CSV files (skip_header=True). No task loader
+uses it: once the fields are decoded and converted into Reservation
+objects or EnergyColumns, it is slower than the loaders' plain line
+splitting, so suite.py only measures the bare scan for comparison.
+"""
+
+import mmap
+import re
+from collections.abc import Iterator
+from functools import lru_cache
+
+
+@lru_cache(maxsize=64)
+def field_pattern(fields: tuple[int, ...], separator: bytes) -> re.Pattern:
+    """
+    Builds a pattern matching one whole line and capturing the given fields.
+    A field can never contain the separator or a newline, so the greedy
+    field matches have nothing to give back, and the rest of the line is
+    consumed so the next match starts right at the next line.
+
+    Parameters:
+     fields (tuple[int, ...]): Wanted field indexes
+     separator (bytes): Field separator, e.g. b"|" or b";"
+
+    Returns:
+     (re.Pattern): Pattern with one group per wanted field, in index order
+    """
+    sep = re.escape(separator)
+    value = b"[^" + sep + b"\n]*"
+    parts = [b"(" + value + b")" if i in fields else value for i in range(max(fields) + 1)]
+    return re.compile(sep.join(parts) + b"[^\n]*\n?")
+
+
+def scan(path: str, fields: tuple[int, ...], separator: bytes = b"|", skip_header: bool = False) -> Iterator[tuple[bytes, ...]]:
+    """
+    Yields the wanted fields of every line as raw bytes
+
+    Parameters:
+     path (str): File to scan
+     fields (tuple[int, ...]): Wanted field indexes
+     separator (bytes): Field separator
+     skip_header (bool): Ignore the first line
+
+    Yields:
+     (tuple[bytes, ...]): Wanted fields in index order; lines with too few fields are skipped
+    """
+    wanted = tuple(sorted(fields))
+    pattern = field_pattern(wanted, separator)
+    with open(path, "rb") as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped
+            return
+    with mapped:
+        start = mapped.find(b"\n") + 1 if skip_header else 0
+        if skip_header and start == 0:
+            return
+        for match in pattern.finditer(mapped, start):
+            yield match.groups()
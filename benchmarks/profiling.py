@@ -0,0 +1,368 @@
+"""
+Opt-in instrumentation of the task scripts: time, rows and peak memory per
+stage (parse, aggregate, format) of any task entry point, plus optional
+cProfile and tracemalloc dumps.
+
+Nothing in the task scripts changes. While a Profiler is enabled, the
+functions listed in TASK_STAGES are replaced by timed wrappers in the task
+module; disable() puts the originals back, so there is no cost when off.
+
+Run from the repository root (the script runs in its own directory, so
+its relative data file names work; extra arguments go to the script):
+    python benchmarks/profiling.py taskD --json timings.json
+    python benchmarks/profiling.py taskE --cprofile taskE.prof -- data/
+    python benchmarks/profiling.py taskG_class --memory --tracemalloc taskG.snapshot
+"""
+
+import argparse
+import contextlib
+import cProfile
+import functools
+import inspect
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+from tasks import ROOT, TASK_FILES, load_task
+
+# Instrumented functions of every task and the stage their own time is counted in.
+# "Class.method" names wrap a method, so isinstance checks on the class keep working;
+# "module.function" names wrap a function of a sibling module (taskG/report_cli.py).
+# create_*_report mostly waits for input(), so it gets a stage of its own.
+TASK_STAGES = {
+    "taskC": {
+        "parse": ["fetch_reservations", "iter_reservations"],
+        "aggregate": ["stream_summary", "evaluate_reports", "confirmation_summary", "total_revenue"],
+        "format": ["write_reports", "confirmed_reservations", "long_reservations", "confirmation_statuses"],
+    },
+    "taskD": {
+        "parse": ["read_data", "iter_data", "read_cache", "CacheWriter.record"],
+        "aggregate": ["PhaseColumns.__init__", "PhaseColumns.reduce_by_day", "daily_totals", "day_info"],
+        "format": ["format_day_info", "print_week_header"],
+    },
+    "taskE": {
+        "parse": ["read_data", "iter_rows", "read_cache", "CacheWriter.record"],
+        "aggregate": ["PhaseColumns.__init__", "PhaseColumns.reduce_by_day", "stream_days",
+                      "day_information", "iter_week_file", "summarize_week_file", "parallel_summary"],
+        "format": ["format_day", "week_header", "week_blocks", "write_data"],
+    },
+    "taskF": {
+        "parse": ["read_data", "read_data_columns", "load_columns_cache", "write_columns_cache"],
+        "aggregate": ["DailyIndex.__init__", "summarize"],
+        "format": ["build_daily_report", "build_monthly_report", "build_yearly_report",
+                   "print_report_to_console", "write_report_to_file"],
+        "input": ["create_daily_report", "create_monthly_report", "create_yearly_report"],
+    },
+    "taskG_class": {
+        "parse": ["fetch_reservations", "iter_reservations", "fetch_reservation_table"],
+        "aggregate": ["report_cli.evaluate", "report_cli.stream_sections", "stream_sections",
+                      "confirmation_summary", "total_revenue"],
+        "format": ["report_cli.print_sections", "confirmed_reservations", "long_reservations",
+                   "confirmation_statuses"],
+    },
+    "taskG_dict": {
+        "parse": ["fetch_reservations", "iter_reservations"],
+        "aggregate": ["report_cli.evaluate", "report_cli.stream_sections", "stream_sections",
+                      "confirmation_summary", "total_revenue"],
+        "format": ["report_cli.print_sections", "confirmed_reservations", "long_reservations",
+                   "confirmation_statuses"],
+    },
+}
+
+
+class Frame:
+    """One running instrumented call: its start and the time spent in instrumented callees."""
+
+    __slots__ = ("stats", "start", "children", "memory_start", "memory_peak")
+
+    def __init__(self, stats: dict, memory: int):
+        self.stats = stats
+        self.children = 0.0
+        self.memory_start = memory
+        self.memory_peak = memory
+        self.start = time.perf_counter()
+
+
+class Profiler:
+    """
+    Collects calls, rows, exclusive time and peak memory per instrumented
+    function. Exclusive time (own time minus instrumented callees) makes the
+    stage totals add up without counting nested calls twice, e.g. iter_data
+    consumed inside daily_totals is parse time, not aggregate time.
+
+    Rows are the length of a returned container, or the number of items a returned
+    generator yields, counted only at the outermost parse call.
+
+    Attributes:
+     memory (bool): Also track peak memory with tracemalloc
+     functions (dict): "stage.name" -> calls, rows, seconds, peak_bytes
+    """
+
+    def __init__(self, memory: bool = False):
+        self.memory = memory
+        self.functions = {}
+        self._stack = []
+        self._patched = []
+        self._started_tracing = False
+
+    def _traced(self) -> int:
+        if not self.memory:
+            return 0
+        current, peak = tracemalloc.get_traced_memory()
+        if self._stack:
+            parent = self._stack[-1]
+            parent.memory_peak = max(parent.memory_peak, peak)
+        tracemalloc.reset_peak()
+        return current
+
+    def _enter(self, stats: dict) -> Frame:
+        frame = Frame(stats, self._traced())
+        self._stack.append(frame)
+        return frame
+
+    def _exit(self, frame: Frame) -> None:
+        elapsed = time.perf_counter() - frame.start
+        self._stack.pop()
+        stats = frame.stats
+        stats["seconds"] += elapsed - frame.children
+        if self._stack:
+            self._stack[-1].children += elapsed
+        if self.memory:
+            frame.memory_peak = max(frame.memory_peak, tracemalloc.get_traced_memory()[1])
+            stats["peak_bytes"] = max(stats["peak_bytes"], frame.memory_peak - frame.memory_start)
+            if self._stack:
+                self._stack[-1].memory_peak = max(self._stack[-1].memory_peak, frame.memory_peak)
+
+    def _outermost_parse(self) -> bool:
+        return not any(frame.stats["stage"] == "parse" for frame in self._stack)
+
+    def instrument(self, function, stage: str, name: str | None = None):
+        """
+        Decorator: returns a wrapper of function that records into this profiler.
+
+        Parameters:
+         function (callable): Wrapped function
+         stage (str): Stage its own time is counted in
+         name (str | None): Reported name, function.__qualname__ by default
+
+        Returns:
+         (callable): The wrapper
+        """
+        stats = self.functions.setdefault(
+            f"{stage}.{name or function.__qualname__}",
+            {"stage": stage, "calls": 0, "rows": 0, "seconds": 0.0, "peak_bytes": 0},
+        )
+        profiler = self
+
+        def count_rows(result) -> None:
+            if stage == "parse" and hasattr(result, "__len__") and profiler._outermost_parse():
+                stats["rows"] += len(result)
+
+        def consume(generator):
+            outermost = stage == "parse" and profiler._outermost_parse()
+            while True:
+                frame = profiler._enter(stats)
+                try:
+                    item = next(generator)
+                except StopIteration:
+                    return
+                finally:
+                    profiler._exit(frame)
+                if outermost:
+                    stats["rows"] += 1
+                yield item
+
+        if inspect.isgeneratorfunction(function):
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                stats["calls"] += 1
+                return consume(function(*args, **kwargs))
+        else:
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                stats["calls"] += 1
+                frame = profiler._enter(stats)
+                try:
+                    result = function(*args, **kwargs)
+                finally:
+                    profiler._exit(frame)
+                count_rows(result)
+                return result
+        return wrapper
+
+    @contextlib.contextmanager
+    def stage(self, stage: str, name: str = "block", rows: int = 0):
+        """
+        Context manager that records a block of code like an instrumented call.
+
+        Parameters:
+         stage (str): Stage of the block
+         name (str): Reported name
+         rows (int): Rows the block handles
+        """
+        stats = self.functions.setdefault(
+            f"{stage}.{name}", {"stage": stage, "calls": 0, "rows": 0, "seconds": 0.0, "peak_bytes": 0}
+        )
+        stats["calls"] += 1
+        stats["rows"] += rows
+        frame = self._enter(stats)
+        try:
+            yield stats
+        finally:
+            self._exit(frame)
+
+    def enable(self, module, stages: dict) -> None:
+        """
+        Replaces the listed functions of module by instrumented wrappers.
+
+        Parameters:
+         module (ModuleType): Loaded task script
+         stages (dict): stage -> function names, see TASK_STAGES
+        """
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        tables = [value for value in vars(module).values() if type(value) in (dict, list)]
+        for stage, names in stages.items():
+            for name in names:
+                owner_name, _, attribute = name.rpartition(".")
+                owner = module
+                if owner_name:
+                    owner = getattr(module, owner_name, None) or sys.modules.get(owner_name)
+                # Read from __dict__ so that the restored value is identical (e.g. no bound methods)
+                original = vars(owner).get(attribute) if owner is not None else None
+                if original is None:
+                    continue
+                wrapper = self.instrument(original, stage, name)
+                self._patched.append((setattr, owner, attribute, original))
+                setattr(owner, attribute, wrapper)
+                # Module-level tables of functions, e.g. REPORTS in task-c.py, call the wrapper too
+                for table in tables:
+                    keys = table.keys() if isinstance(table, dict) else range(len(table))
+                    for key in keys:
+                        if table[key] is original:
+                            self._patched.append((type(table).__setitem__, table, key, original))
+                            table[key] = wrapper
+
+    def disable(self) -> None:
+        """Puts the original functions back."""
+        while self._patched:
+            restore, owner, key, original = self._patched.pop()
+            restore(owner, key, original)
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def report(self) -> dict:
+        """
+        Returns:
+         (dict): "stages" with totals per stage and "functions" with every called function
+        """
+        stages = {}
+        for stats in self.functions.values():
+            if not stats["calls"]:
+                continue
+            total = stages.setdefault(stats["stage"], {"calls": 0, "rows": 0, "seconds": 0.0, "peak_bytes": 0})
+            total["calls"] += stats["calls"]
+            total["rows"] += stats["rows"]
+            total["seconds"] += stats["seconds"]
+            total["peak_bytes"] = max(total["peak_bytes"], stats["peak_bytes"])
+        functions = {name: {key: value for key, value in stats.items() if key != "stage"}
+                     for name, stats in self.functions.items() if stats["calls"]}
+        return {"stages": stages, "functions": functions}
+
+
+@contextlib.contextmanager
+def profiled(task: str, memory: bool = False):
+    """
+    Context manager: instruments a task script for the duration of the block.
+
+    Parameters:
+     task (str): Key in TASK_FILES, e.g. "taskD"
+     memory (bool): Track peak memory per function with tracemalloc
+
+    Yields:
+     (tuple): (loaded task module, Profiler)
+    """
+    module = load_task(task)
+    profiler = Profiler(memory)
+    profiler.enable(module, TASK_STAGES[task])
+    try:
+        yield module, profiler
+    finally:
+        profiler.disable()
+
+
+def run_main(task: str, argv: list, memory: bool = False, profile: cProfile.Profile | None = None) -> dict:
+    """
+    Runs main() of a task script in the script's directory with instrumentation.
+
+    Parameters:
+     task (str): Key in TASK_FILES
+     argv (list): sys.argv[1:] for the script
+     memory (bool): Track peak memory per function
+     profile (cProfile.Profile | None): Also run main under this profiler
+
+    Returns:
+     (dict): Profiler.report() plus the wall time of main
+    """
+    path = ROOT / TASK_FILES[task]
+    saved_argv, saved_cwd = sys.argv, os.getcwd()
+    with profiled(task, memory) as (module, profiler):
+        sys.argv = [str(path), *argv]
+        os.chdir(path.parent)
+        try:
+            start = time.perf_counter()
+            if profile is None:
+                module.main()
+            else:
+                profile.runcall(module.main)
+            wall = time.perf_counter() - start
+        finally:
+            sys.argv = saved_argv
+            os.chdir(saved_cwd)
+        document = profiler.report()
+    document["task"] = task
+    document["wall_seconds"] = wall
+    return document
+
+
+def print_report(document: dict) -> None:
+    """Prints the stage totals of a report to standard error."""
+    print(f"{document['task']}: {document['wall_seconds']:.4f} s", file=sys.stderr)
+    for stage, total in document["stages"].items():
+        print(f"  {stage:<10} {total['seconds']:10.4f} s {total['rows']:>10} rows"
+              f" {total['peak_bytes'] / 2 ** 20:10.1f} MiB", file=sys.stderr)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("task", choices=sorted(TASK_FILES), help="task script to run")
+    parser.add_argument("args", nargs="*", help="arguments of the task script")
+    parser.add_argument("--json", help="write the per-stage timing report to this file")
+    parser.add_argument("--memory", action="store_true", help="track peak memory per stage (slower)")
+    parser.add_argument("--cprofile", help="write cProfile stats (pstats format) to this file")
+    parser.add_argument("--tracemalloc", help="write a tracemalloc snapshot taken at the end to this file")
+    args = parser.parse_args()
+
+    profile = cProfile.Profile() if args.cprofile else None
+    memory = args.memory or bool(args.tracemalloc)
+    if args.tracemalloc:
+        tracemalloc.start()
+    document = run_main(args.task, args.args, memory, profile)
+    if args.tracemalloc:
+        tracemalloc.take_snapshot().dump(args.tracemalloc)
+        tracemalloc.stop()
+    if profile is not None:
+        profile.dump_stats(args.cprofile)
+
+    print_report(document)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(document, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,248 @@
+"""
+Timed and memory-profiled runs of every loader and report of taskC-taskG
+on generated data, written as JSON so two commits can be compared.
+
+Run from the repository root:
+    python benchmarks/suite.py [--rows 100000] [--weeks 52] [--years 1] [--output results.json]
+    python benchmarks/suite.py --compare before.json after.json
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import date, datetime, timedelta
+
+from generators import write_reservations, write_weekly_phases, write_yearly_energy
+from mmap_scan import scan
+from tasks import ROOT, load_task
+
+
+def consume(iterator) -> int:
+    """Runs a lazy loader to the end and returns the number of items."""
+    count = 0
+    for _ in iterator:
+        count += 1
+    return count
+
+
+def generate(directory: str, rows: int, weeks: int, years: int) -> dict:
+    """
+    Writes every input format into directory.
+
+    Parameters:
+     directory (str): Output directory
+     rows (int): Reservations in reservations.txt
+     weeks (int): Weeks of hourly phase data
+     years (int): Years of hourly yearly energy data
+
+    Returns:
+     (dict): "reservations", "phases", "week_files" and "energy" paths
+    """
+    paths = {
+        "reservations": os.path.join(directory, "reservations.txt"),
+        "phases": os.path.join(directory, "phases.csv"),
+        "energy": os.path.join(directory, "energy.csv"),
+        "week_files": [],
+    }
+    write_reservations(paths["reservations"], rows)
+    first_monday = datetime(2025, 1, 6)
+    write_weekly_phases(paths["phases"], weeks * 168, start=first_monday)
+    for week in range(weeks):
+        path = os.path.join(directory, f"week{week + 1:02d}.csv")
+        write_weekly_phases(path, 168, seed=week + 1, start=first_monday + timedelta(weeks=week))
+        paths["week_files"].append(path)
+    write_yearly_energy(paths["energy"], years * 8760)
+    return paths
+
+
+def reservation_cases(paths: dict) -> list:
+    """Loaders and reports of taskC and both taskG variants."""
+    file = paths["reservations"]
+    cases = []
+
+    task_c = load_task("taskC")
+    rows = task_c.fetch_reservations(file)
+    cases += [
+        ("taskC.fetch_reservations", task_c.fetch_reservations, (file,)),
+        ("taskC.iter_reservations", lambda: consume(task_c.iter_reservations(file)), ()),
+        ("taskC.stream_summary", task_c.stream_summary, (file,)),
+        ("mmap_scan.scan[reservations]", lambda: consume(scan(file, (6, 7, 8))), ()),
+    ]
+    cases += [(f"taskC.{report.__name__}", report, (rows,)) for report in (
+        task_c.confirmed_reservations, task_c.long_reservations, task_c.confirmation_statuses,
+        task_c.confirmation_summary, task_c.total_revenue)]
+
+    for name in ("taskG_class", "taskG_dict"):
+        task_g = load_task(name)
+        rows = task_g.fetch_reservations(file)
+        cases += [
+            (f"{name}.fetch_reservations", task_g.fetch_reservations, (file,)),
+            (f"{name}.iter_reservations", lambda task_g=task_g: consume(task_g.iter_reservations(file)), ()),
+            (f"{name}.stream_report", task_g.stream_report, (file,)),
+        ]
+        cases += [(f"{name}.{report.__name__}", report, (rows,)) for report in task_g.REPORTS]
+        if hasattr(task_g, "fetch_reservation_table"):
+            cases.append((f"{name}.fetch_reservation_table", task_g.fetch_reservation_table, (file,)))
+    return cases
+
+
+def phase_cases(paths: dict) -> list:
+    """Loaders and reports of taskD and taskE."""
+    file = paths["phases"]
+    task_d = load_task("taskD")
+    task_e = load_task("taskE")
+    rows = task_d.read_data(file)
+    first_day = rows[0][0].date()
+    days = task_e.summarize_week_file(file)
+    task_d.read_daily_totals(file)  # measured warm: the first call writes the cache
+    task_e.parallel_summary(paths["week_files"])
+    return [
+        ("taskD.read_data", task_d.read_data, (file,)),
+        ("taskD.daily_totals[iter_data]", lambda: task_d.daily_totals(task_d.iter_data(file)), ()),
+        ("taskD.read_daily_totals", task_d.read_daily_totals, (file,)),
+        ("taskD.daily_totals", task_d.daily_totals, (rows,)),
+        ("taskD.day_info", task_d.day_info, (first_day, rows)),
+        ("taskE.read_data", task_e.read_data, (file,)),
+        ("taskE.stream_days", lambda: consume(task_e.stream_days(task_e.iter_rows(file))), ()),
+        ("taskE.summarize_week_file", task_e.summarize_week_file, (file,)),
+        ("taskE.day_information", task_e.day_information, (first_day, rows)),
+        ("taskE.week_blocks", lambda: consume(task_e.week_blocks(days)), ()),
+        ("taskE.parallel_summary", task_e.parallel_summary, (paths["week_files"],)),
+    ]
+
+
+def energy_cases(paths: dict) -> list:
+    """Loaders and report builders of taskF."""
+    file = paths["energy"]
+    task_f = load_task("taskF")
+    columns = task_f.read_data_columns(file)
+    index = task_f.DailyIndex(columns)
+    task_f.read_data_cached(file)  # measured warm: the first call writes the cache
+    first = date.fromordinal(index.days[0])
+    last = date.fromordinal(index.days[-1])
+    return [
+        ("taskF.read_data", task_f.read_data, (file,)),
+        ("taskF.read_data_columns", task_f.read_data_columns, (file,)),
+        ("taskF.read_data_cached", task_f.read_data_cached, (file,)),
+        ("mmap_scan.scan[energy]", lambda: consume(scan(file, (0, 1, 2, 3), b";", skip_header=True)), ()),
+        ("taskF.DailyIndex", task_f.DailyIndex, (columns,)),
+        ("taskF.build_daily_report", task_f.build_daily_report, (index, first, last)),
+        ("taskF.build_daily_report[columns]", task_f.build_daily_report, (columns, first, last)),
+        ("taskF.build_monthly_report", task_f.build_monthly_report, (index, 6, first.year)),
+        ("taskF.build_yearly_report", task_f.build_yearly_report, (index, first.year)),
+    ]
+
+
+def measure(function, args: tuple, repeat: int) -> dict:
+    """
+    Times repeat calls, then makes one more call under tracemalloc.
+    Anything the call prints goes to os.devnull.
+
+    Parameters:
+     function (callable): Measured function
+     args (tuple): Its arguments
+     repeat (int): Number of timed calls
+
+    Returns:
+     (dict): best/median seconds and peak traced bytes
+    """
+    times = []
+    with open(os.devnull, "w", encoding="utf-8") as sink, contextlib.redirect_stdout(sink):
+        for _ in range(repeat):
+            start = time.perf_counter()
+            function(*args)
+            times.append(time.perf_counter() - start)
+        tracemalloc.start()
+        try:
+            function(*args)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return {"best_s": min(times), "median_s": statistics.median(times), "peak_bytes": peak}
+
+
+def git_commit() -> str | None:
+    """Short hash of the checked out commit, None outside a git checkout."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(args) -> dict:
+    """Generates the inputs, measures every case and returns the JSON document."""
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        paths = generate(directory, args.rows, args.weeks, args.years)
+        for group in (reservation_cases, phase_cases, energy_cases):
+            for name, function, call_args in group(paths):
+                if args.only and not any(pattern in name for pattern in args.only):
+                    continue
+                results[name] = measure(function, call_args, args.repeat)
+                print(f"{name:<40} {results[name]['best_s']:10.4f} s {results[name]['peak_bytes'] / 2 ** 20:10.1f} MiB",
+                      file=sys.stderr)
+    return {
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "sizes": {"rows": args.rows, "weeks": args.weeks, "years": args.years},
+        "repeat": args.repeat,
+        "results": results,
+    }
+
+
+def compare(before_file: str, after_file: str) -> None:
+    """Prints the time and memory ratio after/before of every case both files have."""
+    with open(before_file, encoding="utf-8") as f:
+        before = json.load(f)
+    with open(after_file, encoding="utf-8") as f:
+        after = json.load(f)
+    if before["sizes"] != after["sizes"]:
+        print(f"warning: different sizes {before['sizes']} vs {after['sizes']}")
+    print(f"{'case':<40} {'time':>8} {'memory':>8}   ({before['commit']} -> {after['commit']})")
+    for name, new in after["results"].items():
+        old = before["results"].get(name)
+        if old is None:
+            print(f"{name:<40} {'new':>8}")
+            continue
+        time_ratio = new["best_s"] / old["best_s"] if old["best_s"] else float("nan")
+        memory_ratio = new["peak_bytes"] / old["peak_bytes"] if old["peak_bytes"] else float("nan")
+        print(f"{name:<40} {time_ratio:7.2f}x {memory_ratio:7.2f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=100_000, help="reservations in the generated reservations.txt")
+    parser.add_argument("--weeks", type=int, default=52, help="weeks of hourly phase data for taskD/taskE")
+    parser.add_argument("--years", type=int, default=1, help="years of hourly energy data for taskF")
+    parser.add_argument("--repeat", type=int, default=3, help="timed calls per case")
+    parser.add_argument("--only", nargs="*", help="run only the cases whose name contains one of these")
+    parser.add_argument("--output", help="JSON results file, standard output when omitted")
+    parser.add_argument("--compare", nargs=2, metavar=("BEFORE", "AFTER"), help="compare two results files")
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    document = run(args)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(document, f, indent=2)
+    else:
+        json.dump(document, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+Loads the task scripts as modules. Their file names (task-f.py, ...)
+are not valid module names, so they cannot be imported normally.
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+from types import ModuleType
+
+ROOT = Path(__file__).resolve().parent.parent
+
+TASK_FILES = {
+    "taskC": "taskC/task-c.py",
+    "taskD": "taskD/task-d.py",
+    "taskE": "taskE/task-e.py",
+    "taskF": "taskF/task-f.py",
+    "taskG_class": "taskG/task_g_class.py",
+    "taskG_dict": "taskG/task_g_dict.py",
+}
+
+_loaded = {}
+
+
+def load_task(name: str) -> ModuleType:
+    """
+    Loads a task script by its key in TASK_FILES, once.
+
+    Parameters:
+     name (str): Key in TASK_FILES, e.g. "taskF"
+
+    Returns:
+     (ModuleType): The loaded script
+    """
+    if name not in _loaded:
+        path = ROOT / TASK_FILES[name]
+        # Scripts import their sibling modules (e.g. taskG/reservation_parsing.py)
+        if str(path.parent) not in sys.path:
+            sys.path.insert(0, str(path.parent))
+        spec = importlib.util.spec_from_file_location(name.replace("-", "_"), path)
+        module = importlib.util.module_from_spec(spec)
+        # Registered so that pickle finds its functions (taskE.parallel_summary workers)
+        sys.modules[spec.name] = module
+        spec.loader.exec_module(module)
+        _loaded[name] = module
+    return _loaded[name]
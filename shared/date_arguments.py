@@ -0,0 +1,43 @@
+# Copyright (c) 2026 Ville Heikkiniemi, Luka Hietala, Luukas Kola
+#
+# This code is licensed under the MIT License.
+# You are free to use, modify, and distribute this code,
+# provided that the original copyright notice is retained.
+#
+# See LICENSE file in the project root for full license information.
+
+"""
+Dates given by the user: dd.mm.yyyy like the menus ask for, or yyyy-mm-dd
+
+Shared by the command lines of every task, the batch ranges of taskF
+and the taskF report server.
+"""
+
+import argparse
+from datetime import datetime, date
+
+
+def parse_date(text: str) -> date:
+    """
+    Parses a date given as dd.mm.yyyy or yyyy-mm-dd.
+
+    Parameters:
+     text (str): Date as typed
+
+    Returns:
+     (date): Parsed date
+
+    Raises:
+     ValueError: The text is not a valid date in either format
+    """
+    if "." in text:
+        return datetime.strptime(text, "%d.%m.%Y").date()
+    return date.fromisoformat(text)
+
+
+def argument_date(text: str) -> date:
+    """argparse type of a command line date, see parse_date"""
+    try:
+        return parse_date(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid date: {text!r}") from None
@@ -0,0 +1,265 @@
+# Copyright (c) 2026 Ville Heikkiniemi, Luka Hietala, Luukas Kola
+#
+# This code is licensed under the MIT License.
+# You are free to use, modify, and distribute this code,
+# provided that the original copyright notice is retained.
+#
+# See LICENSE file in the project root for full license information.
+
+"""
+Per-phase kernel shared by taskD and taskE
+
+The weekly phase files of both tasks have the same format, so the integer
+per-day reduction (PhaseColumns), the Wh -> kWh rounding and the binary
+cache next to the CSV files live here once. A cache miss still streams
+the file: CacheWriter records the rows while the task aggregates them. The task scripts put this
+directory on sys.path and import from it.
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Iterator
+import contextlib
+from datetime import datetime, date, timedelta
+import mmap
+import os
+import shutil
+import struct
+import tempfile
+
+# Binary cache written next to the CSV: header + timestamps + 6 phase columns per row.
+# Timestamps are wall-clock seconds since 1970-01-01 in chronological order.
+CACHE_MAGIC = b"PHASES02"
+CACHE_HEADER = struct.Struct("=8sqqq")  # magic, source mtime (ns), source size, rows
+EPOCH = datetime(1970, 1, 1)
+SECONDS_PER_DAY = 86400
+
+
+def wall_seconds(moment: datetime) -> int:
+    """Seconds from 1970-01-01 to the wall-clock time of moment; a UTC offset is ignored like in .date()."""
+    return int((moment.replace(tzinfo=None) - EPOCH).total_seconds())
+
+class PhaseColumns:
+    """
+    The six phase columns of the data as one flat integer array
+    (row-major, six values per hour) plus a day index per row.
+    Column i is values[i::6].
+
+    Attributes:
+        days (list[date]): Distinct days in order of first appearance
+        day_index (array): Index into days for every row
+        values (array): Phase values in Wh, 6 per row
+        ordered (bool): True when each day's rows are contiguous
+        timestamps (array | None): wall_seconds of every row, set by from_columns
+    """
+
+    def __init__(self, database: Iterable[list]):
+        self.days = []
+        self.day_index = array("l")
+        self.values = array("q")
+        self.ordered = True
+        self.timestamps = None
+        positions = {}
+        for per_hour in database:
+            day = per_hour[0].date()
+            index = positions.get(day)
+            if index is None:
+                index = positions[day] = len(self.days)
+                self.days.append(day)
+            elif self.day_index[-1] != index:
+                self.ordered = False
+            self.day_index.append(index)
+            self.values.extend(per_hour[1:7])
+
+    @classmethod
+    def from_columns(cls, timestamps: array, values: array) -> "PhaseColumns":
+        """
+        Builds the columns from chronological timestamps and their values
+        without creating a datetime per row: the rows of a day are found
+        by bisecting the timestamps at the next midnight.
+
+        Parameters:
+            timestamps (array): wall_seconds of every row, in order
+            values (array): Phase values in Wh, 6 per row
+
+        Returns:
+            columns (PhaseColumns): Columns with the same days as the rows
+        """
+        columns = cls(())
+        columns.timestamps = timestamps
+        columns.values = values
+        epoch_day = EPOCH.date()
+        start = 0
+        while start < len(timestamps):
+            day_number = timestamps[start] // SECONDS_PER_DAY
+            end = bisect_left(timestamps, (day_number + 1) * SECONDS_PER_DAY, start)
+            columns.day_index.extend(array("l", [len(columns.days)]) * (end - start))
+            columns.days.append(epoch_day + timedelta(days=day_number))
+            start = end
+        return columns
+
+    def __len__(self) -> int:
+        return len(self.day_index)
+
+    def reduce_by_day(self) -> dict[date, list[int]]:
+        """
+        Sums every phase per day in Wh. With contiguous days each day is one
+        slice of the flat array, so the sums are strided slices reduced with
+        sum() instead of a Python loop over every value.
+
+        Returns:
+            totals (dict[date, list[int]]): day -> consumption v1-v3, production v1-v3 in Wh
+        """
+        totals = {}
+        if self.ordered:
+            start = 0
+            for index, day in enumerate(self.days):
+                end = bisect_right(self.day_index, index, start)
+                segment = self.values[start * 6:end * 6]
+                totals[day] = [sum(segment[i::6]) for i in range(6)]
+                start = end
+            return totals
+
+        for day in self.days:
+            totals[day] = [0, 0, 0, 0, 0, 0]
+        for row, index in enumerate(self.day_index):
+            day_totals = totals[self.days[index]]
+            for i in range(6):
+                day_totals[i] += self.values[row * 6 + i]
+        return totals
+
+def cache_path(filename: str) -> str:
+    """Returns the name of the binary cache file belonging to a CSV file."""
+    return filename + ".cache"
+
+class CacheWriter:
+    """
+    Writes the binary cache of a CSV file while its rows stream past, so
+    a cache miss still reads the file in one pass with constant memory.
+    The timestamps go into the cache file and the phase values into a
+    temporary file, which is appended when the stream ends. The cache is
+    published only if every row was seen and the rows were chronological,
+    because reading the cache back finds the days by bisecting the timestamps.
+    A cache that cannot be written is skipped silently.
+
+    Parameters:
+        filename (str): Name of the source CSV file
+    """
+
+    FLUSH_ROWS = 4096
+
+    def __init__(self, filename: str):
+        self.filename = filename
+        self.tmp_name = cache_path(filename) + ".tmp"
+        self.timestamps = array("q")
+        self.values = array("q")
+        self.count = 0
+        self.last = None
+        self.complete = False
+        try:
+            self.stat = os.stat(filename)
+            self.file = open(self.tmp_name, "wb")
+            self.spill = tempfile.TemporaryFile()
+            self.file.write(CACHE_HEADER.pack(CACHE_MAGIC, 0, 0, 0))
+        except OSError:
+            self.close()
+
+    def __enter__(self) -> "CacheWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        try:
+            if self.file is not None and self.complete:
+                self.flush()
+                self.spill.seek(0)
+                shutil.copyfileobj(self.spill, self.file)
+                self.file.seek(0)
+                self.file.write(CACHE_HEADER.pack(CACHE_MAGIC, self.stat.st_mtime_ns, self.stat.st_size, self.count))
+                self.file.close()
+                self.file = None
+                os.replace(self.tmp_name, cache_path(self.filename))
+        except OSError:
+            pass
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Stops writing and removes the unfinished cache file."""
+        for name in ("file", "spill"):
+            stream = getattr(self, name, None)
+            if stream is not None:
+                stream.close()
+            setattr(self, name, None)
+        with contextlib.suppress(OSError):
+            os.remove(self.tmp_name)
+
+    def flush(self) -> None:
+        self.file.write(self.timestamps.tobytes())
+        self.spill.write(self.values.tobytes())
+        del self.timestamps[:]
+        del self.values[:]
+
+    def record(self, rows: Iterable[list]) -> Iterator[list]:
+        """
+        Passes the rows through unchanged and records them in the cache.
+
+        Parameters:
+            rows (Iterable[list]): Converted rows of filename
+
+        Yields:
+            row (list): The same rows
+        """
+        for row in rows:
+            if self.file is not None:
+                seconds = wall_seconds(row[0])
+                if self.last is not None and seconds < self.last:
+                    self.close()
+                else:
+                    self.last = seconds
+                    self.timestamps.append(seconds)
+                    self.values.extend(row[1:7])
+                    self.count += 1
+                    if len(self.timestamps) >= self.FLUSH_ROWS:
+                        try:
+                            self.flush()
+                        except OSError:
+                            self.close()
+            yield row
+        self.complete = True
+
+def read_cache(filename: str) -> PhaseColumns | None:
+    """
+    Reads the columns back from the binary cache if it still matches the CSV file.
+
+    Parameters:
+        filename (str): Name of the source CSV file
+
+    Returns:
+        columns (PhaseColumns | None): Cached columns, None if the cache is missing or stale
+    """
+    try:
+        stat = os.stat(filename)
+        with open(cache_path(filename), "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+    with mapped:
+        if len(mapped) < CACHE_HEADER.size:
+            return None
+        magic, mtime_ns, size, count = CACHE_HEADER.unpack_from(mapped)
+        if (magic, mtime_ns, size) != (CACHE_MAGIC, stat.st_mtime_ns, stat.st_size):
+            return None
+        if len(mapped) != CACHE_HEADER.size + count * 8 * 7:
+            return None
+        timestamps = array("q", mapped[CACHE_HEADER.size:CACHE_HEADER.size + count * 8])
+        values = array("q", mapped[CACHE_HEADER.size + count * 8:])
+
+    return PhaseColumns.from_columns(timestamps, values)
+
+def wh_to_kwh(wh: int) -> float:
+    """
+    Converts a Wh total to kWh, rounded half up to the two decimals shown
+    in the report. Rounding the exact integer avoids 6395 Wh printing as 6,39.
+    """
+    return (wh + 5) // 10 / 100
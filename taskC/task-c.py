@@ -20,7 +20,19 @@ int | str | str | str | date | time | int | float | bool | str | datetime
 
 """
 
-from datetime import datetime
+import argparse
+from collections.abc import Iterable, Iterator
+import contextlib
+from datetime import date, datetime, time
+from functools import lru_cache
+import json
+import os
+import sys
+from typing import TextIO
+
+# The date format of the command line is shared by all tasks (shared/date_arguments.py)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "shared"))
+from date_arguments import argument_date  # noqa: E402
 
 HEADERS = [
     "reservationId",
@@ -36,17 +48,99 @@ HEADERS = [
     "createdAt",
 ]
 
+# Report lines collected before one write to the output stream
+BUFFER_LINES = 4096
 
-def convert_reservation_data(reservation: list) -> list:
+
+@lru_cache(maxsize=4096)
+def parse_date(text: str) -> date:
+    """Parses a YYYY-MM-DD field without strptime; repeated dates hit the cache."""
+    return date.fromisoformat(text)
+
+
+@lru_cache(maxsize=1440)
+def parse_time(text: str) -> time:
+    """Parses a HH:MM field without strptime."""
+    return time.fromisoformat(text)
+
+
+@lru_cache(maxsize=4096)
+def finnish_day(day: date) -> str:
+    """Formats a date as dd.mm.yyyy, once per distinct date."""
+    return day.strftime("%d.%m.%Y")
+
+
+@lru_cache(maxsize=1440)
+def finnish_time(start: time) -> str:
+    """Formats a time as hh.mm, once per distinct time."""
+    return start.strftime("%H.%M")
+
+
+def flush_lines(lines: list[str], out: TextIO | None) -> None:
+    """
+    Writes the collected lines with a single write call and empties the list
+
+    Parameters:
+     lines (list[str]): Lines without newlines ("" is an empty line)
+     out (TextIO | None): Output stream, standard output when None
+    """
+    if lines:
+        (out or sys.stdout).write("\n".join(lines) + "\n")
+        lines.clear()
+
+
+# Converter of every column, in HEADERS order, for projected loading
+CONVERTERS = [
+    int,
+    str,
+    str,
+    str,
+    parse_date,
+    parse_time,
+    int,
+    float,
+    lambda text: text == "True",
+    str,
+    lambda text: datetime.fromisoformat(text.strip()),
+]
+
+
+def requires(*fields: str):
+    """
+    Declares which columns (HEADERS names) a report function reads
+
+    Parameters:
+     fields (str): Column names
+    """
+    def decorate(function):
+        function.fields = frozenset(fields)
+        return function
+    return decorate
+
+
+def fields_for(*reports) -> frozenset:
+    """Returns the union of the columns declared by report functions"""
+    return frozenset().union(*(report.fields for report in reports))
+
+
+def convert_reservation_data(reservation: list, fields=None) -> list:
     """
     Convert data types to meet program requirements
 
     Parameters:
      reservation (list): Unconverted reservation -> 11 columns
+     fields (frozenset | None): Only convert these columns, the rest are None
 
     Returns:
      converted (list): Converted data types
     """
+    if fields is not None:
+        converted = [None] * len(HEADERS)
+        for header in fields:
+            i = HEADERS.index(header)
+            converted[i] = CONVERTERS[i](reservation[i])
+        return converted
+
     converted = []
     # Convert the first element = reservation[0]
     converted.append(int(reservation[0]))  # reservationId (str -> int)
@@ -57,9 +151,9 @@ def convert_reservation_data(reservation: list) -> list:
     
     converted.append(reservation[3])  # phone (str)
     
-    converted.append(datetime.strptime(reservation[4], "%Y-%m-%d").date())  # reservationDate (date)
+    converted.append(parse_date(reservation[4]))  # reservationDate (date)
     
-    converted.append(datetime.strptime(reservation[5], "%H:%M").time())  # reservationTime (time)
+    converted.append(parse_time(reservation[5]))  # reservationTime (time)
     
     converted.append(int(reservation[6]))  # durationHours (int)
     
@@ -69,19 +163,20 @@ def convert_reservation_data(reservation: list) -> list:
     
     converted.append(reservation[9])  # reservedResource (str)
     
-    createdAt = datetime.strptime(reservation[10].strip(), "%Y-%m-%d %H:%M:%S")
+    createdAt = datetime.fromisoformat(reservation[10].strip())
     converted.append(createdAt)  # createdAt (datetime)
     
     return converted
 
 
-def fetch_reservations(reservation_file: str) -> list:
+def fetch_reservations(reservation_file: str, fields=None) -> list:
     """
     Reads reservations from a file and returns the reservations converted
     You don't need to modify this function!
 
     Parameters:
      reservation_file (str): Name of the file containing the reservations
+     fields (frozenset | None): Only convert these columns (see fields_for)
 
     Returns:
      reservations (list): Read and converted reservations
@@ -89,52 +184,187 @@ def fetch_reservations(reservation_file: str) -> list:
     reservations = []
     with open(reservation_file, "r", encoding="utf-8") as f:
         for line in f:
-            fields = line.split("|")
-            reservations.append(convert_reservation_data(fields))
+            reservations.append(convert_reservation_data(line.split("|"), fields))
     return reservations
 
 
-def confirmed_reservations(reservations: list[list]) -> None:
+def iter_reservations(reservation_file: str, fields=None) -> Iterator[list]:
     """
-    Print confirmed reservations
+    Reads reservations from a file lazily, one converted reservation at a time
 
     Parameters:
-     reservations (list): Reservations
+     reservation_file (str): Name of the file containing the reservations
+     fields (frozenset | None): Only convert these columns (see fields_for)
+
+    Yields:
+     reservation (list): Next converted reservation
+    """
+    with open(reservation_file, "r", encoding="utf-8") as f:
+        for line in f:
+            yield convert_reservation_data(line.split("|"), fields)
+
+
+def confirmed_line(n: list) -> str:
+    """Line of one reservation in the confirmed reservations report"""
+    return f'{n[1]}, {n[9]}, {finnish_day(n[4])} at {finnish_time(n[5])}'
+
+
+def long_line(n: list) -> str:
+    """Line of one reservation in the long reservations report"""
+    return f'{n[1]}, {finnish_day(n[4])} at {finnish_time(n[5])}, duration {n[6]} h, {n[9]}'
+
+
+def status_line(n: list) -> str:
+    """Line of one reservation in the confirmation status report"""
+    status = "Confirmed" if n[8] else "NOT Confirmed"
+    return f'{n[1]} → {status}'
+
+
+def stream_summary(reservation_file: str) -> None:
+    """
+    Prints the long reservations, the confirmation summary and the total
+    revenue in one pass over the file, in constant memory. The long
+    reservations are printed as they are read, the rest are counters.
+
+    Parameters:
+     reservation_file (str): Name of the file containing the reservations
+    """
+    confirmed = 0
+    not_confirmed = 0
+    revenue = 0
+
+    lines = [TITLES["long"]]
+    fields = fields_for(long_reservations, confirmation_summary, total_revenue)
+    for n in iter_reservations(reservation_file, fields):
+        if n[6]>=3:
+            lines.append(long_line(n))
+            if len(lines) >= BUFFER_LINES:
+                flush_lines(lines, None)
+        if n[8]:
+            confirmed += 1
+            revenue += n[7]
+        else:
+            not_confirmed += 1
+    lines.append("")
+    flush_lines(lines, None)
+    write_reports({"summary": (confirmed, not_confirmed), "revenue": revenue}, ["summary", "revenue"])
+
+
+# Report titles, in the default output order
+TITLES = {
+    "confirmed": "1) Confirmed Reservations",
+    "long": "2) Long Reservations (≥ 3 h)",
+    "statuses": "3) Reservation Confirmation Status",
+    "summary": "4) Confirmation Summary",
+    "revenue": "5) Total Revenue from Confirmed Reservations",
+}
+
+# Which reservations the list reports include
+CONDITIONS = {
+    "confirmed": lambda n: n[8],
+    "long": lambda n: n[6]>=3,
+    "statuses": lambda n: True,
+}
+
+# Text line of one reservation in each list report
+LINES = {
+    "confirmed": confirmed_line,
+    "long": long_line,
+    "statuses": status_line,
+}
+
+
+def evaluate_reports(reservations: Iterable[list], names: list[str], entries: dict = LINES) -> dict:
+    """
+    Fills the selected reports in a single pass over the reservations
+
+    Parameters:
+     reservations (Iterable): Reservations, a list or a stream
+     names (list[str]): Keys of TITLES
+     entries (dict): List report name -> function making the entry of one reservation
+
+    Returns:
+     results (dict): report name -> list of entries, (confirmed, not confirmed) or revenue
     """
-    print()
-    print("1) Confirmed Reservations")
+    found = {name: [] for name in names if name in CONDITIONS}
+    lists = [(CONDITIONS[name], entries[name], found[name]) for name in found]
+    confirmed = 0
+    not_confirmed = 0
+    revenue = 0
     for n in reservations:
+        for condition, entry, matching in lists:
+            if condition(n):
+                matching.append(entry(n))
         if n[8]:
-            print(f'{n[1]}, {n[9]}, {n[4].strftime("%d.%m.%Y")} at {n[5].strftime("%H.%M")}')
-    print()
+            confirmed += 1
+            revenue += n[7]
+        else:
+            not_confirmed += 1
+
+    return {"summary": (confirmed, not_confirmed), "revenue": revenue, **found}
+
 
-def long_reservations(reservations: list[list]) -> None:
+def write_reports(results: dict, names: list[str], out: TextIO | None = None) -> None:
+    """
+    Prints the selected reports from the results of evaluate_reports
+
+    Parameters:
+     results (dict): Filled reports
+     names (list[str]): Keys of TITLES, in output order
+     out (TextIO | None): Output stream, standard output when None
+    """
+    for name in names:
+        # The confirmed reservations start and every report but the revenue ends with an empty line
+        lines = ["", TITLES[name]] if name == "confirmed" else [TITLES[name]]
+        if name == "summary":
+            confirmed, not_confirmed = results[name]
+            lines += [f'Confirmed reservations: {confirmed} pcs', f'Not confirmed reservations: {not_confirmed} pcs', ""]
+        elif name == "revenue":
+            lines.append(f'Total revenue from confirmed reservations: {results[name]:.2f}'.replace('.', ',') + ' €')
+        else:
+            for line in results[name]:
+                lines.append(line)
+                if len(lines) >= BUFFER_LINES:
+                    flush_lines(lines, out)
+            lines.append("")
+        flush_lines(lines, out)
+
+
+@requires("confirmed", "name", "reservedResource", "reservationDate", "reservationTime")
+def confirmed_reservations(reservations: list[list], out: TextIO | None = None) -> None:
+    """
+    Print confirmed reservations
+
+    Parameters:
+     reservations (list): Reservations
+     out (TextIO | None): Output stream, standard output when None
+    """
+    write_reports(evaluate_reports(reservations, ["confirmed"]), ["confirmed"], out)
+
+@requires("durationHours", "name", "reservationDate", "reservationTime", "reservedResource")
+def long_reservations(reservations: list[list], out: TextIO | None = None) -> None:
     """
     Print long reservations
 
     Parameters:
      reservations (list): Reservations
+     out (TextIO | None): Output stream, standard output when None
     """
-    print("2) Long Reservations (≥ 3 h)")
-    for n in reservations:
-        if n[6]>=3:
-            print(f'{n[1]}, {n[4].strftime("%d.%m.%Y")} at {n[5].strftime("%H.%M")}, duration {n[6]} h, {n[9]}')
-    print()
+    write_reports(evaluate_reports(reservations, ["long"]), ["long"], out)
 
 
-def confirmation_statuses(reservations: list[list]) -> None:
+@requires("name", "confirmed")
+def confirmation_statuses(reservations: list[list], out: TextIO | None = None) -> None:
     """
     Print confirmation statuses
 
     Parameters:
      reservations (list): Reservations
+     out (TextIO | None): Output stream, standard output when None
     """
-    print("3) Reservation Confirmation Status")
-    for n in reservations:
-        status = "Confirmed" if n[8] else "NOT Confirmed"
-        print(f'{n[1]} → {status}')
-    print()
+    write_reports(evaluate_reports(reservations, ["statuses"]), ["statuses"], out)
 
+@requires("confirmed")
 def confirmation_summary(reservations: list[list]) -> None:
     """
     Print confirmation summary
@@ -142,20 +372,9 @@ def confirmation_summary(reservations: list[list]) -> None:
     Parameters:
      reservations (list): Reservations
     """
-    print("4) Confirmation Summary")
-    confirmed = 0
-    not_confirmed = 0
-
-    for n in reservations:
-        if n[8]:
-            confirmed += 1
-        else:
-            not_confirmed += 1
-
-    print(f'Confirmed reservations: {confirmed} pcs')
-    print(f'Not confirmed reservations: {not_confirmed} pcs')
-    print()
+    write_reports(evaluate_reports(reservations, ["summary"]), ["summary"])
 
+@requires("price", "confirmed")
 def total_revenue(reservations: list[list]) -> None:
     """
     Print total revenue
@@ -163,22 +382,82 @@ def total_revenue(reservations: list[list]) -> None:
     Parameters:
      reservations (list): Reservations
     """
-    print("5) Total Revenue from Confirmed Reservations")
-    
-    total_revenue = 0
-    for n in reservations:
-        if n[8]:
-            total_revenue += n[7]
+    write_reports(evaluate_reports(reservations, ["revenue"]), ["revenue"])
+
 
-    print(f'Total revenue from confirmed reservations: {total_revenue:.2f}'.replace('.', ',') + ' €')
+# Report names of the command line, in the default output order
+REPORTS = {
+    "confirmed": confirmed_reservations,
+    "long": long_reservations,
+    "statuses": confirmation_statuses,
+    "summary": confirmation_summary,
+    "revenue": total_revenue,
+}
 
 
-def main():
+def report_data(reservations: Iterable[list], names: list[str]) -> dict:
+    """
+    The content of the selected reports as JSON-ready data, from one pass
+
+    Parameters:
+     reservations (Iterable): Reservations
+     names (list[str]): Keys of REPORTS
+
+    Returns:
+     data (dict): report name -> records, counts or total
+    """
+    def record(n):
+        return {header: value.isoformat() if hasattr(value, "isoformat") else value
+                for header, value in zip(HEADERS, n)}
+
+    entries = {
+        "confirmed": record,
+        "long": record,
+        "statuses": lambda n: {"name": n[1], "confirmed": n[8]},
+    }
+    results = evaluate_reports(reservations, names, entries)
+    data = {}
+    for name in names:
+        if name == "summary":
+            confirmed, not_confirmed = results[name]
+            data[name] = {"confirmed": confirmed, "not_confirmed": not_confirmed}
+        elif name == "revenue":
+            data[name] = round(results[name], 2)
+        else:
+            data[name] = results[name]
+    return data
+
+
+def parse_arguments(argv: list[str] | None = None) -> argparse.Namespace:
+    """
+    Reads the command line options. Without options the program works
+    as before: all reports of reservations.txt to the console.
+
+    Parameters:
+     argv (list[str] | None): Arguments, sys.argv[1:] when None
+    """
+    parser = argparse.ArgumentParser(description="Prints reservation reports")
+    parser.add_argument("-i", "--input", default="reservations.txt", help="reservations file")
+    parser.add_argument("-o", "--output", help="output file instead of the console")
+    parser.add_argument("-r", "--report", action="append", choices=list(REPORTS),
+                        help="report to print, can be repeated (default: all)")
+    parser.add_argument("--from", dest="start", type=argument_date, help="first reservation date to include")
+    parser.add_argument("--to", dest="end", type=argument_date, help="last reservation date to include")
+    parser.add_argument("-f", "--format", choices=["text", "json"], default="text", help="output format")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None):
     """
     Prints reservation information according to requirements
     Reservation-specific printing is done in functions
     """
-    reservations = fetch_reservations("reservations.txt")
+    args = parse_arguments(argv)
+    reservations = fetch_reservations(args.input)
+    if args.start or args.end:
+        reservations = [n for n in reservations
+                        if (args.start is None or n[4] >= args.start) and (args.end is None or n[4] <= args.end)]
+    names = args.report or list(REPORTS)
     # PART A -> Before continuing to part B, make sure that the following lines
     # print all the reservation data and the correct data types to the console. 
     # After that, you can remove this section or comment it out up to part B.
@@ -195,11 +474,13 @@ def main():
     # PART B -> Build the output required in part B from this using
     # the predefined functions and the necessary print statements.
 
-    confirmed_reservations(reservations)
-    long_reservations(reservations)
-    confirmation_statuses(reservations)
-    confirmation_summary(reservations)
-    total_revenue(reservations)
+    output = open(args.output, "w", encoding="utf-8") if args.output else contextlib.nullcontext(sys.stdout)
+    with output as out, contextlib.redirect_stdout(out):
+        if args.format == "json":
+            json.dump(report_data(reservations, names), out, ensure_ascii=False, indent=2)
+            print()
+            return
+        write_reports(evaluate_reports(reservations, names), names, out)
 
 
 if __name__ == "__main__":
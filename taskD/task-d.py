@@ -8,7 +8,19 @@
 
 # Modified by Mehdi according to given taskD
 
+from collections.abc import Iterable, Iterator
+import argparse
+import contextlib
 from datetime import datetime, date
+import json
+import os
+import sys
+
+# PhaseColumns, wh_to_kwh and the binary cache are shared with taskE (shared/phase_kernel.py),
+# the command line date format with all tasks (shared/date_arguments.py)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "shared"))
+from date_arguments import argument_date  # noqa: E402
+from phase_kernel import CacheWriter, PhaseColumns, read_cache, wh_to_kwh  # noqa: E402
 
 DAYS = [
     "Monday",
@@ -64,6 +76,70 @@ def read_data(filename: str) -> list:
 
     return consumption_and_production
 
+def iter_data(filename: str) -> Iterator[list]:
+    """
+    Reads the CSV file lazily, one converted row at a time.
+
+    Parameters:
+        filename (str): Name of the file containing the electricity consumption and production
+
+    Yields:
+        row (list): Converted row (see convert_data)
+    """
+    with open(filename, "r", encoding="utf-8") as f:
+        next(f)
+        for line in f:
+            line = line.strip()
+            if line:
+                yield convert_data(line.split(";"))
+
+def daily_totals(database: Iterable[list]) -> dict[date, list]:
+    """
+    Sums the consumption and production of every day found in the data
+    in one pass. The days come out in the order they appear in the data.
+
+    Parameters:
+        database (Iterable[list]): Consumption and production date + dates
+
+    Returns:
+        totals (dict[date, list]): day -> consumption v1-v3, production v1-v3 in kWh
+    """
+    totals = PhaseColumns(database).reduce_by_day()
+    return {day: [wh_to_kwh(value) for value in wh] for day, wh in totals.items()}
+
+def read_daily_totals(filename: str) -> dict[date, list]:
+    """
+    Loads the CSV file and finds the covered days and their totals
+    in the same pass. The integer columns are cached next to the file,
+    so an unchanged file is not parsed again.
+
+    Parameters:
+        filename (str): Name of the file containing the electricity consumption and production
+
+    Returns:
+        totals (dict[date, list]): day -> consumption v1-v3, production v1-v3 in kWh
+    """
+    columns = read_cache(filename)
+    if columns is not None:
+        return {day: [wh_to_kwh(value) for value in wh] for day, wh in columns.reduce_by_day().items()}
+    with CacheWriter(filename) as cache:
+        return daily_totals(cache.record(iter_data(filename)))
+
+def format_day_info(day: date, totals: list) -> str:
+    """
+    Formats the totals of one day.
+
+    Parameters:
+        day (date): Reportable day
+        totals (list): Consumption v1-v3 and production v1-v3 in kWh
+
+    Returns:
+        printable string
+    """
+    cp1, cp2, cp3, pp4, pp5, pp6 = (f"{value:.2f}".replace(".", ",") for value in totals)
+
+    return f'{day.strftime("%d.%m.%Y"):<15}' + f"{cp1:<8}"+f"{cp2:<8}"+f"{cp3:<15}"+f"{pp4:<8}"+f"{pp5:<8}"+f"{pp6:<8}"
+
 def day_info(day: date, database: list ) -> str:
     """
     Reads the consumption and production per day.
@@ -75,47 +151,95 @@ def day_info(day: date, database: list ) -> str:
     Returns:
         printable string
     """
+    totals = daily_totals(per_hour for per_hour in database if per_hour[0].date() == day)
+    return format_day_info(day, totals.get(day, [0, 0, 0, 0, 0, 0]))
 
-    consumption_phase1 = 0
-    consumption_phase2 = 0
-    consumption_phase3 = 0
-
-    production_phase1 = 0
-    production_phase2 = 0
-    production_phase3 = 0
-    for per_hour in database:
-        if per_hour[0].date() == day:
-            consumption_phase1 += per_hour[1]/1000
-            consumption_phase2 += per_hour[2]/1000
-            consumption_phase3 += per_hour[3]/1000
-            production_phase1 += per_hour[4]/1000
-            production_phase2 += per_hour[5]/1000
-            production_phase3 += per_hour[6]/1000
-
-    cp1 = f"{consumption_phase1:.2f}".replace(".", ",")
-    cp2 = f"{consumption_phase2:.2f}".replace(".", ",")
-    cp3 = f"{consumption_phase3:.2f}".replace(".", ",")
-    pp4 = f"{production_phase1:.2f}".replace(".", ",")
-    pp5 = f"{production_phase2:.2f}".replace(".", ",")
-    pp6 = f"{production_phase3:.2f}".replace(".", ",")
-
-    return f'{day.strftime("%d.%m.%Y"):<15}' + f"{cp1:<8}"+f"{cp2:<8}"+f"{cp3:<15}"+f"{pp4:<8}"+f"{pp5:<8}"+f"{pp6:<8}"
-
-def main() -> None:
-    """Main function: reads data, computes daily totals, and prints the report."""
+def print_week_header(week: int) -> None:
+    """
+    Prints the report header of one week.
 
-    db = read_data("week42.csv")
-    print("Week 42 electricity consumption and production (kWh, by phase)", end="\n\n")
+    Parameters:
+        week (int): ISO week number
+    """
+    print(f"Week {week} electricity consumption and production (kWh, by phase)", end="\n\n")
     print("Day        Date           Consumption [kWh]               Production [kWh]")
     print("           (dd.mm.yyyy)   v1      v2      v3              v1      v2      v3")
     print("---------------------------------------------------------------------------")
-    print(f"{DAYS[0]:<10}", day_info(date(2025, 10, 13), db))
-    print(f"{DAYS[1]:<10}", day_info(date(2025, 10, 14), db))
-    print(f"{DAYS[2]:<10}", day_info(date(2025, 10, 15), db))
-    print(f"{DAYS[3]:<10}", day_info(date(2025, 10, 16), db))
-    print(f"{DAYS[4]:<10}", day_info(date(2025, 10, 17), db))
-    print(f"{DAYS[5]:<10}", day_info(date(2025, 10, 18), db))
-    print(f"{DAYS[6]:<10}", day_info(date(2025, 10, 19), db))
+
+def print_report(totals: dict[date, list]) -> None:
+    """
+    Prints the daily totals as week tables.
+
+    Parameters:
+        totals (dict[date, list]): day -> consumption v1-v3, production v1-v3 in kWh
+    """
+    current_week = None
+    for day, day_totals in totals.items():
+        week = day.isocalendar()[:2]
+        if week != current_week:
+            if current_week is not None:
+                print()
+            current_week = week
+            print_week_header(week[1])
+        print(f"{DAYS[day.weekday()]:<10}", format_day_info(day, day_totals))
+
+def print_csv(totals: dict[date, list]) -> None:
+    """
+    Prints the daily totals as a semicolon-separated, decimal-comma CSV.
+
+    Parameters:
+        totals (dict[date, list]): day -> consumption v1-v3, production v1-v3 in kWh
+    """
+    print("Day;Date;Consumption v1 kWh;Consumption v2 kWh;Consumption v3 kWh;"
+          "Production v1 kWh;Production v2 kWh;Production v3 kWh")
+    for day, day_totals in totals.items():
+        values = ";".join(f"{value:.2f}".replace(".", ",") for value in day_totals)
+        print(f'{DAYS[day.weekday()]};{day.strftime("%d.%m.%Y")};{values}')
+
+def print_json(totals: dict[date, list]) -> None:
+    """
+    Prints the daily totals as JSON.
+
+    Parameters:
+        totals (dict[date, list]): day -> consumption v1-v3, production v1-v3 in kWh
+    """
+    days = [
+        {"date": day.isoformat(), "consumption_kwh": day_totals[:3], "production_kwh": day_totals[3:]}
+        for day, day_totals in totals.items()
+    ]
+    print(json.dumps(days, indent=2))
+
+def parse_arguments(argv: list[str] | None = None) -> argparse.Namespace:
+    """
+    Reads the command line options. Without options the report of
+    week42.csv is printed to the console, as before.
+
+    Parameters:
+        argv (list[str] | None): Arguments, sys.argv[1:] when None
+    """
+    parser = argparse.ArgumentParser(description="Prints daily electricity consumption and production by phase")
+    parser.add_argument("inputs", nargs="*", default=["week42.csv"], help="hourly phase CSV files")
+    parser.add_argument("-o", "--output", help="output file instead of the console")
+    parser.add_argument("--from", dest="start", type=argument_date, help="first day to include")
+    parser.add_argument("--to", dest="end", type=argument_date, help="last day to include")
+    parser.add_argument("-f", "--format", choices=["text", "csv", "json"], default="text", help="output format")
+    return parser.parse_args(argv)
+
+def main(argv: list[str] | None = None) -> None:
+    """Main function: reads data, computes daily totals, and prints the report."""
+    args = parse_arguments(argv)
+    totals = {}
+    for filename in args.inputs:
+        totals.update(read_daily_totals(filename))
+    if len(args.inputs) > 1:
+        totals = dict(sorted(totals.items()))
+    if args.start or args.end:
+        totals = {day: day_totals for day, day_totals in totals.items()
+                  if (args.start is None or day >= args.start) and (args.end is None or day <= args.end)}
+
+    output = open(args.output, "w", encoding="utf-8") if args.output else contextlib.nullcontext(sys.stdout)
+    with output as out, contextlib.redirect_stdout(out):
+        {"text": print_report, "csv": print_csv, "json": print_json}[args.format](totals)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -8,7 +8,21 @@
 
 # Modified by Mehdi according to given taskE
 
+import argparse
+from collections.abc import Iterable, Iterator
+from itertools import chain
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, date
+import glob
+import json
+import os
+import sys
+
+# PhaseColumns, wh_to_kwh and the binary cache are shared with taskD (shared/phase_kernel.py),
+# the command line date format with all tasks (shared/date_arguments.py)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "shared"))
+from date_arguments import argument_date  # noqa: E402
+from phase_kernel import CacheWriter, PhaseColumns, read_cache, wh_to_kwh  # noqa: E402
 
 DAYS = [
     "Monday",
@@ -20,6 +34,8 @@ DAYS = [
     "Sunday",
 ]
 
+WEEK_FILES = ["week41.csv", "week42.csv", "week43.csv"]
+
 
 def convert_data(line: list) -> list:
     """
@@ -62,6 +78,69 @@ def read_data(filename: str) -> list:
 
     return cons_prod
 
+def iter_rows(filename: str) -> Iterator[list]:
+    """
+    Reads the CSV file one row at a time.
+
+    Parameters:
+        filename (str): Name of the file containing the electricity consumption and production
+
+    Yields:
+        row (list): Converted row (see convert_data)
+    """
+    with open(filename, "r", encoding="utf-8") as f:
+        next(f)
+        for line in f:
+            line = line.strip()
+            if line:
+                yield convert_data(line.split(";"))
+
+def stream_days(rows: Iterable[list]) -> Iterator[tuple[date, list]]:
+    """
+    Groups chronologically ordered rows by calendar day in a single pass.
+    A day is yielded as soon as the first row of the next day is seen,
+    so only one day's totals are kept in memory at a time.
+
+    Parameters:
+        rows (Iterable[list]): Converted rows, e.g. from iter_rows
+
+    Yields:
+        (tuple): day, [consumption v1-v3, production v1-v3] in kWh
+    """
+    current_day = None
+    totals = []
+    for per_hour in rows:
+        day = per_hour[0].date()
+        if day != current_day:
+            if current_day is not None:
+                yield current_day, [wh_to_kwh(value) for value in totals]
+            current_day = day
+            totals = [0, 0, 0, 0, 0, 0]
+        for i in range(6):
+            totals[i] += per_hour[i + 1]
+
+    if current_day is not None:
+        yield current_day, [wh_to_kwh(value) for value in totals]
+
+def format_day(day: date, totals: list) -> str:
+    """
+    Formats one summary row.
+
+    Parameters:
+        day (date): Reportable day
+        totals (list): Consumption v1-v3 and production v1-v3 in kWh
+
+    Returns:
+        printable string
+    """
+    converted_cons_prod = f"{DAYS[day.weekday()]:<11}"
+    converted_cons_prod += f'{day.strftime("%d.%m.%Y"):<13}'
+    for element in totals:
+        two_decimal_to_string = f"{element:.2f}".replace("." , ",")
+        converted_cons_prod += f"{two_decimal_to_string:<8}"
+
+    return converted_cons_prod + "\n"
+
 def day_information(day: date, database: list ) -> str:
     """
     Reads the consumption and production per day.
@@ -73,23 +152,9 @@ def day_information(day: date, database: list ) -> str:
     Returns:
         printable string
     """
-
-    cons_prod = ["day" , "date" , 0, 0, 0, 0, 0, 0]
-    for per_hour in database:
-        if per_hour[0].date() == day:
-            for i in range(1, len(per_hour)):
-                cons_prod[i + 1] += per_hour[i] / 1000
-                cons_prod[0] = DAYS[day.weekday()]
-                cons_prod[1] = day
-
-    converted_cons_prod = f"{cons_prod[0]:<11}"
-    converted_cons_prod += f'{cons_prod[1].strftime("%d.%m.%Y"):<13}'
-    for i, element in enumerate(cons_prod):
-        if i > 1:
-            two_decimal_to_string = f"{element:.2f}".replace("." , ",")
-            converted_cons_prod += f"{two_decimal_to_string:<8}"
-
-    return converted_cons_prod+ "\n"
+    totals = PhaseColumns(row for row in database if row[0].date() == day).reduce_by_day()
+    wh = totals.get(day, [0, 0, 0, 0, 0, 0])
+    return format_day(day, [wh_to_kwh(value) for value in wh])
 
 def week_header(number: int) -> str:
     """
@@ -107,38 +172,200 @@ def week_header(number: int) -> str:
     header += "---------------------------------------------------------------------------\n"
     return header
 
-def write_data(content: str):
+def write_data(content: str, filename: str = "summary.txt"):
     """
     Writes the content to the file.
 
     Parameters:
         content (str): Content
+        filename (str): Output file
     """
-    with open("summary.txt", "w" , encoding="utf-8") as f:
+    with open(filename, "w" , encoding="utf-8") as f:
         f.write(content)
 
-def main() -> None:
+def week_blocks(days: Iterable[tuple[date, list]]) -> Iterator[str]:
+    """
+    Turns a stream of day totals into week sections. The week number of
+    each header comes from the ISO calendar of the data, and a new section
+    starts whenever the ISO week changes, so a file may cover any number of days.
+
+    Parameters:
+        days (Iterable[tuple[date, list]]): Day totals, e.g. from stream_days
+
+    Yields:
+        printable string for one week
+    """
+    current_week = None
+    block = ""
+    for day, totals in days:
+        week = day.isocalendar()[:2]
+        if week != current_week:
+            if block:
+                yield block
+            current_week = week
+            block = week_header(week[1])
+        block += format_day(day, totals)
+
+    if block:
+        yield block
+
+def iter_week_file(filename: str) -> Iterator[tuple[date, list]]:
+    """
+    Streams one week file into per-day totals with stream_days, one day
+    in memory at a time. The rows are recorded in the binary cache on the
+    way, so an unchanged file is summed from the cached columns next time.
+
+    Parameters:
+        filename (str): Name of the week's CSV file
+
+    Yields:
+        (tuple): day, [consumption v1-v3, production v1-v3] in kWh, in file order
+    """
+    columns = read_cache(filename)
+    if columns is not None:
+        for day, wh in columns.reduce_by_day().items():
+            yield day, [wh_to_kwh(value) for value in wh]
+        return
+    with CacheWriter(filename) as cache:
+        yield from stream_days(cache.record(iter_rows(filename)))
+
+def summarize_week_file(filename: str) -> list[tuple[date, list]]:
+    """
+    Worker for the parallel mode: the day totals of one week file (see iter_week_file).
+
+    Parameters:
+        filename (str): Name of the week's CSV file
+
+    Returns:
+        (list): [(day, totals), ...] in file order
+    """
+    return list(iter_week_file(filename))
+
+def find_week_files(source: str) -> list[str]:
+    """
+    Lists the week files of a directory (*.csv) or of a glob pattern.
+
+    Parameters:
+        source (str): Directory or glob pattern
+
+    Returns:
+        (list[str]): Matching file names, sorted
+    """
+    if os.path.isdir(source):
+        source = os.path.join(source, "*.csv")
+    return sorted(glob.glob(source))
+
+def parallel_days(filenames: list[str], workers: int | None = None) -> list[tuple[date, list]]:
+    """
+    Parses and aggregates week files across a process pool and merges
+    the per-day totals in week order.
+
+    Parameters:
+        filenames (list[str]): Week CSV files
+        workers (int | None): Number of processes, defaults to the number of cores
+
+    Returns:
+        (list): [(day, totals), ...] in date order
+    """
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = [days for days in pool.map(summarize_week_file, filenames) if days]
+
+    results.sort(key=lambda days: days[0][0])
+    return list(chain.from_iterable(results))
+
+def parallel_summary(filenames: list[str], workers: int | None = None) -> str:
+    """
+    Parses and aggregates week files across a process pool and merges
+    the results into one summary in week order.
+
+    Parameters:
+        filenames (list[str]): Week CSV files
+        workers (int | None): Number of processes, defaults to the number of cores
+
+    Returns:
+        printable string
+    """
+    return "\n\n".join(week_blocks(parallel_days(filenames, workers)))
+
+def days_csv(days: Iterable[tuple[date, list]]) -> str:
+    """
+    Formats day totals as a semicolon-separated, decimal-comma CSV.
+
+    Parameters:
+        days (Iterable[tuple[date, list]]): Day totals, e.g. from stream_days
+
+    Returns:
+        CSV text
+    """
+    lines = ["Day;Date;Consumption v1 kWh;Consumption v2 kWh;Consumption v3 kWh;"
+             "Production v1 kWh;Production v2 kWh;Production v3 kWh"]
+    for day, totals in days:
+        values = ";".join(f"{value:.2f}".replace(".", ",") for value in totals)
+        lines.append(f'{DAYS[day.weekday()]};{day.strftime("%d.%m.%Y")};{values}')
+    return "\n".join(lines)
+
+def days_json(days: Iterable[tuple[date, list]]) -> str:
+    """
+    Formats day totals as JSON.
+
+    Parameters:
+        days (Iterable[tuple[date, list]]): Day totals, e.g. from stream_days
+
+    Returns:
+        JSON text
+    """
+    return json.dumps([
+        {"date": day.isoformat(), "consumption_kwh": totals[:3], "production_kwh": totals[3:]}
+        for day, totals in days
+    ], indent=2)
+
+def parse_arguments(argv: list[str] | None = None) -> argparse.Namespace:
+    """
+    Reads the command line options. Without options the summary of
+    WEEK_FILES is written to summary.txt and printed, as before.
+
+    Parameters:
+        argv (list[str] | None): Arguments, sys.argv[1:] when None
+    """
+    parser = argparse.ArgumentParser(description="Summarizes weekly electricity consumption and production")
+    parser.add_argument("inputs", nargs="*",
+                        help="week CSV files, directories or glob patterns (read in parallel, default: WEEK_FILES)")
+    parser.add_argument("-o", "--output", default="summary.txt", help="output file")
+    parser.add_argument("-q", "--quiet", action="store_true", help="do not print the summary to the console")
+    parser.add_argument("-j", "--jobs", type=int, help="number of worker processes")
+    parser.add_argument("--from", dest="start", type=argument_date, help="first day to include")
+    parser.add_argument("--to", dest="end", type=argument_date, help="last day to include")
+    parser.add_argument("-f", "--format", choices=["text", "csv", "json"], default="text", help="output format")
+    return parser.parse_args(argv)
+
+def main(argv: list[str] | None = None) -> None:
     """Main function: reads data, computes daily totals, and prints the report."""
-    #Week 41
-    db = read_data("week41.csv")
-    file_content = week_header(41)
-    for i in range(6, 13):
-        file_content += day_information(date(2025, 10, i), db)
-
-    #Week 42
-    db = read_data("week42.csv")
-    file_content += "\n\n" + week_header(42)
-    for i in range(13, 20):
-        file_content += day_information(date(2025, 10, i), db)
-
-    #Week 43
-    db = read_data("week43.csv")
-    file_content += "\n\n" + week_header(43)
-    for i in range(20, 27):
-        file_content += day_information(date(2025, 10, i), db)
-
-    write_data(file_content)
-    print(file_content)
+    args = parse_arguments(argv)
+    if args.inputs or args.jobs:
+        filenames = []
+        for source in args.inputs or WEEK_FILES:
+            matches = find_week_files(source)
+            if not matches:
+                # Nothing to summarize: keep the previous output file as it is
+                sys.exit(f"error: no week files match {source!r}")
+            filenames += matches
+        days = parallel_days(filenames, args.jobs)
+    else:
+        days = chain.from_iterable(iter_week_file(filename) for filename in WEEK_FILES)
+    if args.start or args.end:
+        days = ((day, totals) for day, totals in days
+                if (args.start is None or day >= args.start) and (args.end is None or day <= args.end))
+
+    if args.format == "csv":
+        file_content = days_csv(days)
+    elif args.format == "json":
+        file_content = days_json(days)
+    else:
+        file_content = "\n\n".join(week_blocks(days))
+
+    write_data(file_content, args.output)
+    if not args.quiet:
+        print(file_content)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,275 @@
+# Copyright (c) 2026 Ville Heikkiniemi
+#
+# This code is licensed under the MIT License.
+# You are free to use, modify, and distribute this code,
+# provided that the original copyright notice is retained.
+#
+# See LICENSE file in the project root for full license information.
+
+"""
+Local HTTP/JSON server for the daily, monthly and yearly reports of task-f.py
+
+The data file is loaded once into a DailyIndex that every connection
+shares. A report is then two binary searches over the per-day prefix sums,
+so requests are answered directly on the event loop. Reloading parses the
+file in a worker thread and swaps the index in when it is ready, so the
+running requests are never blocked by it.
+
+    GET  /daily?start=01.03.2025&end=31.03.2025
+    GET  /monthly?month=3[&year=2025]
+    GET  /yearly[?year=2025]
+    POST /reload
+    GET  /stats
+
+Every answer is JSON: the report text as task-f.py prints it, the totals,
+and the version of the loaded data. Built reports are kept in a ReportCache,
+which /stats shows the hit and miss counters of.
+"""
+
+import argparse
+import asyncio
+import importlib.util
+import json
+import traceback
+from datetime import date
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+# task-f.py is not a valid module name, so it is loaded from its path
+_spec = importlib.util.spec_from_file_location("task_f", Path(__file__).with_name("task-f.py"))
+task_f = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(task_f)
+
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 500: "Internal Server Error"}
+
+
+class RequestError(Exception):
+    """A request that cannot be answered, with the HTTP status to answer it with."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+def query_date(query: dict, name: str) -> date:
+    """Reads a date parameter (dd.mm.yyyy or yyyy-mm-dd like task_f.parse_date), 400 when it is invalid."""
+    text = query[name][0]
+    try:
+        return task_f.parse_date(text)
+    except ValueError:
+        raise RequestError(400, f"invalid date: {text!r}") from None
+
+
+def query_int(query: dict, name: str, default: int | None = None) -> int:
+    """Reads an integer query parameter, 400 when it is missing or not a number."""
+    values = query.get(name)
+    if not values:
+        if default is None:
+            raise RequestError(400, f"missing parameter: {name}")
+        return default
+    try:
+        return int(values[0])
+    except ValueError:
+        raise RequestError(400, f"invalid {name}: {values[0]!r}") from None
+
+
+def content_length(headers: dict) -> int:
+    """Length of the request body from the Content-Length header, 0 without one."""
+    text = headers.get("content-length") or "0"
+    try:
+        length = int(text)
+    except ValueError:
+        raise RequestError(400, f"invalid Content-Length: {text!r}") from None
+    if length < 0:
+        raise RequestError(400, f"invalid Content-Length: {text!r}")
+    return length
+
+
+def query_year(query: dict) -> int:
+    """Reads ?year= (2025 by default), 400 when it is outside the years date supports."""
+    year = query_int(query, "year", 2025)
+    if not 1 <= year <= 9999:
+        raise RequestError(400, f"invalid year: {year}")
+    return year
+
+
+class ReportService:
+    """
+    The loaded data and the report queries over it.
+
+    Attributes:
+     filename (str): CSV file the data comes from
+     index (DailyIndex): Per-day prefix sums shared by all requests
+     version (int): Incremented on every (re)load
+     reports (ReportCache): Built reports of the current data
+    """
+
+    def __init__(self, filename: str, cache_size: int = 1024):
+        self.filename = filename
+        self.index = task_f.DailyIndex(task_f.read_data_cached(filename))
+        self.version = 1
+        self.reports = task_f.ReportCache(cache_size)
+
+    async def reload(self) -> dict:
+        """Parses the file again in a worker thread and swaps the new index in."""
+        index = await asyncio.to_thread(lambda: task_f.DailyIndex(task_f.read_data_cached(self.filename)))
+        self.index = index
+        self.version += 1
+        return {"version": self.version, "days": len(index.days)}
+
+    def answer(self, report: str, start_date: date, end_date: date) -> dict:
+        """
+        Builds the JSON answer of one report.
+
+        Parameters:
+         report (str): Report text built by task_f (through the ReportCache)
+         start_date (date): First day of the reported range
+         end_date (date): Last day of the reported range
+
+        Returns:
+         (dict): report text, totals and data version
+        """
+        return {"report": report, **task_f.report_totals(self.index, start_date, end_date), "version": self.version}
+
+    def daily(self, query: dict) -> dict:
+        """Report of the range ?start=..&end=.."""
+        if "start" not in query or "end" not in query:
+            raise RequestError(400, "start and end are required")
+        start_date = query_date(query, "start")
+        end_date = query_date(query, "end")
+        if end_date < start_date:
+            raise RequestError(400, "end is before start")
+        return self.answer(self.reports.daily(self.index, start_date, end_date), start_date, end_date)
+
+    def monthly(self, query: dict) -> dict:
+        """Report of ?month=1-12 of ?year= (2025 by default)."""
+        month = query_int(query, "month")
+        year = query_year(query)
+        if not 1 <= month <= 12:
+            raise RequestError(400, f"invalid month: {month}")
+        report = self.reports.monthly(self.index, month, year)
+        return self.answer(report, *task_f.report_range("monthly", month, year))
+
+    def yearly(self, query: dict) -> dict:
+        """Report of ?year= (2025 by default)."""
+        year = query_year(query)
+        return self.answer(self.reports.yearly(self.index, year), *task_f.report_range("yearly", year=year))
+
+    async def dispatch(self, method: str, target: str) -> tuple[int, dict]:
+        """
+        Answers one request.
+
+        Parameters:
+         method (str): HTTP method
+         target (str): Path and query string
+
+        Returns:
+         (tuple): HTTP status, JSON body
+        """
+        url = urlsplit(target)
+        routes = {"/daily": self.daily, "/monthly": self.monthly, "/yearly": self.yearly}
+        try:
+            if url.path == "/reload":
+                if method != "POST":
+                    raise RequestError(405, "use POST")
+                return 200, await self.reload()
+            if url.path == "/stats":
+                return 200, {"version": self.version, "cache": self.reports.stats()}
+            if url.path not in routes:
+                raise RequestError(404, f"unknown report: {url.path}")
+            if method != "GET":
+                raise RequestError(405, "use GET")
+            return 200, routes[url.path](parse_qs(url.query))
+        except RequestError as error:
+            return error.status, {"error": str(error)}
+        except Exception as error:
+            # A bug must not take the connection down silently: log it and answer 500
+            traceback.print_exc()
+            return 500, {"error": f"internal error: {type(error).__name__}"}
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serves the requests of one connection; HTTP/1.1 connections are kept alive."""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if not line.strip():
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                parts = request_line.decode("latin-1").split()
+                try:
+                    if len(parts) != 3:
+                        raise RequestError(400, "malformed request line")
+                    length = content_length(headers)
+                except RequestError as error:
+                    # Without a valid request line and body length the next request cannot be found
+                    status, body = error.status, {"error": str(error)}
+                    keep_alive = False
+                else:
+                    if length:
+                        await reader.readexactly(length)
+                    status, body = await self.dispatch(parts[0], parts[1])
+                    keep_alive = parts[2] == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+
+                payload = json.dumps(body, ensure_ascii=False).encode("utf-8")
+                writer.write(
+                    f"HTTP/1.1 {status} {REASONS[status]}\r\n"
+                    f"Content-Type: application/json; charset=utf-8\r\n"
+                    f"Content-Length: {len(payload)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode("latin-1") + payload
+                )
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            # The client went away in the middle of a request
+            pass
+        finally:
+            writer.close()
+
+
+async def serve(service: ReportService, host: str = "127.0.0.1", port: int = 8080) -> asyncio.Server:
+    """
+    Starts listening; the caller runs the returned server.
+
+    Parameters:
+     service (ReportService): Loaded data
+     host (str): Address to listen on
+     port (int): Port, 0 picks a free one
+
+    Returns:
+     (asyncio.Server): Started server
+    """
+    return await asyncio.start_server(service.handle, host, port)
+
+
+async def run(filename: str, host: str, port: int) -> None:
+    """Loads the data and serves until interrupted."""
+    service = await asyncio.to_thread(ReportService, filename)
+    server = await serve(service, host, port)
+    host, port = server.sockets[0].getsockname()[:2]
+    print(f"Serving {filename} on http://{host}:{port}", flush=True)
+    async with server:
+        await server.serve_forever()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serves the taskF energy reports as JSON over HTTP")
+    parser.add_argument("--data", default=str(Path(__file__).with_name("2025.csv")), help="hourly energy CSV")
+    parser.add_argument("--host", default="127.0.0.1", help="address to listen on")
+    parser.add_argument("--port", type=int, default=8080, help="port, 0 picks a free one")
+    args = parser.parse_args()
+    try:
+        asyncio.run(run(args.data, args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -8,7 +8,47 @@
 
 # Modified by Mehdi according to given taskF
 
-from datetime import datetime, date
+import argparse
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+from datetime import datetime, date, timezone
+import calendar
+import io
+import itertools
+import json
+import math
+import mmap
+from operator import attrgetter, le
+import os
+import struct
+import sys
+from typing import TextIO
+
+# The date format of the command line and the ranges files is shared by all tasks (shared/date_arguments.py)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "shared"))
+from date_arguments import argument_date, parse_date  # noqa: E402
+
+MONTH_NAMES = [
+    "", "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December"
+]
+
+# Values in the file have at most three decimals
+VALUE_DECIMALS = 3
+VALUE_SCALE = 10 ** VALUE_DECIMALS
+
+# read_data_columns converts the file in batches of about this many bytes of lines
+READ_BATCH_BYTES = 1 << 16
+
+# Binary cache written next to the CSV: header + the five columns back to back (rows sorted by day)
+CACHE_MAGIC = b"ENCOLS02"
+CACHE_HEADER = struct.Struct("=8sqqq")  # magic, source mtime (ns), source size, rows
+CACHE_COLUMNS = ("timestamps", "days", "consumption", "production", "temperature")
+
+# Every load of the data gets a new version, so cached reports of older data are never reused
+DATA_VERSIONS = itertools.count(1)
 
 def convert_data(line: list) -> list:
     """
@@ -48,6 +88,617 @@ def read_data(filename: str) -> list:
 
     return cons_prod
 
+class EnergyColumns:
+    """
+    The same data as read_data returns, stored column by column in typed arrays
+    instead of one list per hour. Rows are sorted by day (see sort_by_day).
+
+    Attributes:
+     timestamps (array): Seconds since 1970-01-01 UTC for each hour (int64)
+     days (array): Local calendar day of each hour as a date ordinal (int64)
+     consumption (array): Net consumption in kWh (float64)
+     production (array): Net production in kWh (float64)
+     temperature (array): Daily average temperature in °C (float64)
+     version (int): Identifies this load of the data (see ReportCache)
+    """
+
+    def __init__(self):
+        self.version = next(DATA_VERSIONS)
+        self.timestamps = array("q")
+        self.days = array("q")
+        self.consumption = array("d")
+        self.production = array("d")
+        self.temperature = array("d")
+
+    def __len__(self):
+        return len(self.days)
+
+    def extend(self, stamps: Iterable[str], cons: Iterable[str], prod: Iterable[str],
+               temp: Iterable[str], *extra) -> None:
+        """
+        Appends rows given as columns of text fields, with decimal points.
+        Every column is converted with one map() over the batch instead of
+        Python code per row. Times without a UTC offset count as UTC.
+
+        Parameters:
+         stamps (Iterable[str]): ISO timestamps like 2025-01-01T00:00:00.000+02:00
+         cons (Iterable[str]): Net consumption in kWh
+         prod (Iterable[str]): Net production in kWh
+         temp (Iterable[str]): Daily average temperature in °C
+         extra: Further columns of the file, ignored
+        """
+        moments = list(map(datetime.fromisoformat, map(str.strip, stamps)))
+        if not all(map(attrgetter("tzinfo"), moments)):
+            moments = [moment if moment.tzinfo else moment.replace(tzinfo=timezone.utc) for moment in moments]
+        self.timestamps.extend(map(int, map(datetime.timestamp, moments)))
+        self.days.extend(map(datetime.toordinal, moments))
+        self.consumption.extend(map(float, cons))
+        self.production.extend(map(float, prod))
+        self.temperature.extend(map(float, temp))
+
+    def is_sorted(self) -> bool:
+        """Tells whether the days column is in ascending order, as span() needs."""
+        return all(map(le, self.days, itertools.islice(self.days, 1, None)))
+
+    def sort_by_day(self) -> None:
+        """
+        Reorders the rows by day and by time within a day. Needed when
+        files of several sites or years were concatenated out of order.
+        """
+        order = sorted(range(len(self.days)), key=list(zip(self.days, self.timestamps)).__getitem__)
+        for name in CACHE_COLUMNS:
+            column = getattr(self, name)
+            setattr(self, name, array(column.typecode, map(column.__getitem__, order)))
+
+    def span(self, start_date: date, end_date: date) -> tuple[int, int]:
+        """
+        Returns the row slice [first, last) covering the inclusive date range.
+        The days column is sorted, so this is two binary searches. A range
+        that ends before it starts is empty.
+        """
+        first = bisect_left(self.days, start_date.toordinal())
+        last = max(bisect_right(self.days, end_date.toordinal()), first)
+        return first, last
+
+    def totals(self, start_date: date, end_date: date, exact: bool = True) -> tuple[float, float, float, int]:
+        """
+        Sums consumption, production and temperature over an inclusive date range.
+        See summarize for the exact parameter.
+
+        Returns:
+         (tuple): consumption sum, production sum, temperature sum, number of hours
+        """
+        first, last = self.span(start_date, end_date)
+        add = exact_sum if exact else sum
+        return (
+            add(self.consumption[first:last]),
+            add(self.production[first:last]),
+            add(self.temperature[first:last]),
+            last - first,
+        )
+
+def read_data_columns(filename: str) -> EnergyColumns:
+    """
+    Reads the CSV file straight into typed columns. The lines are split
+    and converted in batches (see EnergyColumns.extend), and the rows are
+    sorted by day if the file is not in order.
+
+    Parameters:
+     filename (str): Name of the file containing the electricity consumption and production
+
+    Returns:
+     columns (EnergyColumns): Read and converted consumption and production
+    """
+    columns = EnergyColumns()
+
+    with open(filename, "r", encoding="utf-8") as f:
+        next(f)
+        while lines := f.readlines(READ_BATCH_BYTES):
+            text = "".join(lines).replace(",", ".")
+            rows = [fields for fields in (line.split(";") for line in text.splitlines()) if len(fields) >= 4]
+            if rows:
+                columns.extend(*zip(*rows))
+
+    if not columns.is_sorted():
+        columns.sort_by_day()
+    return columns
+
+class DailyIndex:
+    """
+    Per-day prefix sums built once from the loaded data. Any date range
+    total or average is then two binary searches and a subtraction,
+    instead of a scan over every hour.
+
+    The sums are kept as integers in thousandths (VALUE_SCALE). That keeps the subtraction
+    in a range query exact no matter how far apart the two prefixes are.
+
+    Attributes:
+     days (list[int]): Sorted date ordinals that have data
+     consumption (list[int]): Prefix sums of consumption, len(days) + 1 items
+     production (list[int]): Prefix sums of production
+     temperature (list[int]): Prefix sums of temperature
+     hours (list[int]): Prefix sums of the number of hourly rows
+     version (int): Version of the data the index was built from
+    """
+
+    def __init__(self, data):
+        per_day = {}
+        self.version = getattr(data, "version", None) or next(DATA_VERSIONS)
+        if isinstance(data, EnergyColumns):
+            rows = zip(data.days, data.consumption, data.production, data.temperature)
+        else:
+            rows = ((r[0].date().toordinal(), r[1], r[2], r[3]) for r in data)
+        for day, cons, prod, temp in rows:
+            totals = per_day.get(day)
+            if totals is None:
+                totals = per_day[day] = [0, 0, 0, 0]
+            totals[0] += round(cons * VALUE_SCALE)
+            totals[1] += round(prod * VALUE_SCALE)
+            totals[2] += round(temp * VALUE_SCALE)
+            totals[3] += 1
+
+        self.days = sorted(per_day)
+        self.consumption = [0]
+        self.production = [0]
+        self.temperature = [0]
+        self.hours = [0]
+        for day in self.days:
+            cons, prod, temp, count = per_day[day]
+            self.consumption.append(self.consumption[-1] + cons)
+            self.production.append(self.production[-1] + prod)
+            self.temperature.append(self.temperature[-1] + temp)
+            self.hours.append(self.hours[-1] + count)
+
+    def totals(self, start_date: date, end_date: date, exact: bool = True) -> tuple[float, float, float, int]:
+        """
+        Sums consumption, production and temperature over an inclusive date range.
+        The integer prefix sums are always exact, so exact is accepted only
+        to match the other data types. A range that ends before it starts is empty.
+
+        Returns:
+         (tuple): consumption sum, production sum, temperature sum, number of hours
+        """
+        first = bisect_left(self.days, start_date.toordinal())
+        last = max(bisect_right(self.days, end_date.toordinal()), first)
+        return (
+            (self.consumption[last] - self.consumption[first]) / VALUE_SCALE,
+            (self.production[last] - self.production[first]) / VALUE_SCALE,
+            (self.temperature[last] - self.temperature[first]) / VALUE_SCALE,
+            self.hours[last] - self.hours[first],
+        )
+
+def cache_path(filename: str) -> str:
+    """Returns the name of the binary cache file belonging to a CSV file."""
+    return filename + ".cache"
+
+def write_columns_cache(columns: EnergyColumns, filename: str) -> None:
+    """
+    Writes the columns to the binary cache next to the CSV file. The source
+    file's mtime and size are stored so a changed CSV is parsed again.
+
+    Parameters:
+     columns (EnergyColumns): Columns read from filename
+     filename (str): Name of the source CSV file
+    """
+    stat = os.stat(filename)
+    tmp_name = cache_path(filename) + ".tmp"
+    with open(tmp_name, "wb") as f:
+        f.write(CACHE_HEADER.pack(CACHE_MAGIC, stat.st_mtime_ns, stat.st_size, len(columns)))
+        for name in CACHE_COLUMNS:
+            f.write(getattr(columns, name).tobytes())
+    os.replace(tmp_name, cache_path(filename))
+
+def load_columns_cache(filename: str) -> EnergyColumns | None:
+    """
+    Reads the columns back from the binary cache of a CSV file. The file
+    is memory-mapped and each column is copied out in one slice, so
+    nothing is parsed and the mapping is closed before returning.
+
+    Parameters:
+     filename (str): Name of the source CSV file
+
+    Returns:
+     columns (EnergyColumns | None): Cached columns, None if the cache is missing or stale
+    """
+    try:
+        stat = os.stat(filename)
+        with open(cache_path(filename), "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+    with mapped:
+        if len(mapped) < CACHE_HEADER.size:
+            return None
+        magic, mtime_ns, size, rows = CACHE_HEADER.unpack_from(mapped)
+        if (magic, mtime_ns, size) != (CACHE_MAGIC, stat.st_mtime_ns, stat.st_size):
+            return None
+        if len(mapped) != CACHE_HEADER.size + rows * 8 * len(CACHE_COLUMNS):
+            return None
+
+        columns = EnergyColumns()
+        offset = CACHE_HEADER.size
+        for name in CACHE_COLUMNS:
+            typecode = getattr(columns, name).typecode
+            setattr(columns, name, array(typecode, mapped[offset:offset + rows * 8]))
+            offset += rows * 8
+    return columns
+
+def read_data_cached(filename: str) -> EnergyColumns:
+    """
+    Like read_data_columns, but reuses the binary cache next to the CSV file
+    when it is up to date and writes it after parsing when it is not.
+
+    Parameters:
+     filename (str): Name of the file containing the electricity consumption and production
+
+    Returns:
+     columns (EnergyColumns): Read and converted consumption and production
+    """
+    columns = load_columns_cache(filename)
+    if columns is None:
+        columns = read_data_columns(filename)
+        try:
+            write_columns_cache(columns, filename)
+        except OSError:
+            pass
+    return columns
+
+def exact_sum(values) -> float:
+    """
+    Sums values read from the file without float drift. math.fsum is exact
+    for the binary values, and rounding to the file's decimals removes
+    the representation error of the inputs themselves, so the result is
+    the same as summing the decimal strings.
+    """
+    return round(math.fsum(values), VALUE_DECIMALS)
+
+def summarize(data, start_date: date, end_date: date, exact: bool = True) -> tuple[float, float, float, int]:
+    """
+    Sums consumption, production and temperature over an inclusive date range.
+
+    Parameters:
+     data (list | EnergyColumns | DailyIndex): Consumption and production data + dates
+     start_date (date): First day of the range
+     end_date (date): Last day of the range
+     exact (bool): Use drift-free summation (exact_sum) instead of adding floats one by one
+
+    Returns:
+     (tuple): consumption sum, production sum, temperature sum, number of hours
+    """
+    if isinstance(data, (EnergyColumns, DailyIndex)):
+        return data.totals(start_date, end_date, exact)
+
+    rows = [per_hour for per_hour in data if start_date <= per_hour[0].date() <= end_date]
+    if exact:
+        return (
+            exact_sum(per_hour[1] for per_hour in rows),
+            exact_sum(per_hour[2] for per_hour in rows),
+            exact_sum(per_hour[3] for per_hour in rows),
+            len(rows),
+        )
+
+    cons = 0.0
+    prod = 0.0
+    temp = 0.0
+    for per_hour in rows:
+        cons += per_hour[1]
+        prod += per_hour[2]
+        temp += per_hour[3]
+    return cons, prod, temp, len(rows)
+
+def format_average(total: float, count: int) -> str:
+    """Average with two decimals and a decimal comma, 0,00 when there is no data."""
+    if count == 0:
+        return "0,00"
+    return f"{(total / count):.2f}".replace(".", ",")
+
+def build_daily_report(data, start_date: date, end_date: date, period: str | None = None) -> str:
+    """
+    Builds a report for a date range without asking anything from the user.
+
+    Parameters:
+     data (list | EnergyColumns | DailyIndex): Consumption and production data + dates
+     start_date (date): First day of the range
+     end_date (date): Last day of the range
+     period (str | None): Period in the header as the user typed it, dd.mm.yyyy-dd.mm.yyyy by default
+
+    Returns:
+     msg (str): printable string based on the date range
+    """
+    cons, prod, temp, i = summarize(data, start_date, end_date)
+    if period is None:
+        period = f"{start_date.strftime('%d.%m.%Y')}-{end_date.strftime('%d.%m.%Y')}"
+    msg = f"\nReport for the period {period}\n"
+    msg += f"- Total consumption: " + f"{cons:.2f}".replace(".", ",") + f" kWh\n"
+    msg += f"- Total production: " + f"{prod:.2f}".replace(".", ",") + f" kWh\n"
+    msg += f"- Average temperature: " + format_average(temp, i) + f" °C\n"
+    return msg
+
+def build_monthly_report(data, month_num: int, year: int = 2025) -> str:
+    """
+    Builds a monthly summary report without asking anything from the user.
+
+    Parameters:
+     data (list | EnergyColumns | DailyIndex): Consumption and production data + dates
+     month_num (int): Month 1-12
+     year (int): Year of the month
+
+    Returns:
+     (str): Printable report for the selected month
+    """
+    cons, prod, temp, i = summarize(data, *report_range("monthly", month_num, year))
+    sep = "-----------------------------------------------------\n"
+    msg = sep
+    msg += f"Report for the month: {MONTH_NAMES[month_num]}\n"
+    msg += f"- Total consumption: {f'{cons:.2f}'.replace('.', ',')} kWh\n"
+    msg += f"- Total production: {f'{prod:.2f}'.replace('.', ',')} kWh\n"
+    msg += f"- Average temperature: {format_average(temp, i)} °C\n"
+    return msg
+
+def build_yearly_report(data, year: int = 2025) -> str:
+    """
+    Builds a full-year summary report.
+
+    Parameters:
+     data (list | EnergyColumns | DailyIndex): Consumption and production data + dates
+     year (int): Reported year
+
+    Returns:
+     (str): Printable report for the full year
+    """
+    cons, prod, temp, i = summarize(data, date(year, 1, 1), date(year, 12, 31))
+    sep = "-----------------------------------------------------\n"
+    msg = sep
+    msg += f"Report for the year: {year}\n"
+    msg += f"- Total consumption: {f'{cons:.2f}'.replace('.', ',')} kWh\n"
+    msg += f"- Total production: {f'{prod:.2f}'.replace('.', ',')} kWh\n"
+    msg += f"- Average temperature: {format_average(temp, i)} °C\n"
+    return msg
+
+class ReportCache:
+    """
+    Bounded LRU cache of built reports, keyed by report type, parameters and
+    data version. Loading the data again gives it a new version, and the first
+    lookup against the new version drops everything cached for the old one.
+    Data without a version (a plain list from read_data) is never cached.
+
+    Attributes:
+     maxsize (int): Number of reports kept
+     hits (int): Lookups answered from the cache
+     misses (int): Lookups that built the report
+    """
+
+    def __init__(self, maxsize: int = 128):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.version = None
+        self.reports = OrderedDict()
+
+    def __len__(self):
+        return len(self.reports)
+
+    def get(self, kind: str, build, data, *params) -> str:
+        """
+        Returns the cached report or builds and caches it.
+
+        Parameters:
+         kind (str): Report type, e.g. "daily"
+         build (callable): Builder called as build(data, *params)
+         data (EnergyColumns | DailyIndex): Data of the report
+         params: Normalized report parameters
+
+        Returns:
+         (str): Printable report
+        """
+        version = getattr(data, "version", None)
+        if version is None:
+            self.misses += 1
+            return build(data, *params)
+        if version != self.version:
+            self.reports.clear()
+            self.version = version
+
+        key = (kind, params, version)
+        report = self.reports.get(key)
+        if report is not None:
+            self.hits += 1
+            self.reports.move_to_end(key)
+            return report
+
+        self.misses += 1
+        report = self.reports[key] = build(data, *params)
+        if len(self.reports) > self.maxsize:
+            self.reports.popitem(last=False)
+        return report
+
+    def daily(self, data, start_date: date, end_date: date, period: str | None = None) -> str:
+        """Cached build_daily_report."""
+        return self.get("daily", build_daily_report, data, start_date, end_date, period)
+
+    def monthly(self, data, month_num: int, year: int = 2025) -> str:
+        """Cached build_monthly_report."""
+        return self.get("monthly", build_monthly_report, data, month_num, year)
+
+    def yearly(self, data, year: int = 2025) -> str:
+        """Cached build_yearly_report."""
+        return self.get("yearly", build_yearly_report, data, year)
+
+    def clear(self) -> None:
+        """Drops every cached report and resets the counters."""
+        self.reports.clear()
+        self.version = None
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict:
+        """Hit/miss counters and fill level for tuning maxsize."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "size": len(self.reports),
+            "maxsize": self.maxsize,
+        }
+
+def report_totals(data, start_date: date, end_date: date) -> dict:
+    """
+    The totals of a report as JSON-ready data.
+
+    Parameters:
+     data (list | EnergyColumns | DailyIndex): Consumption and production data + dates
+     start_date (date): First day of the range
+     end_date (date): Last day of the range
+
+    Returns:
+     (dict): range, consumption and production in kWh, average temperature, hours
+    """
+    cons, prod, temp, hours = summarize(data, start_date, end_date)
+    return {
+        "start": start_date.isoformat(),
+        "end": end_date.isoformat(),
+        "consumption_kwh": round(cons, 2),
+        "production_kwh": round(prod, 2),
+        "average_temperature": round(temp / hours, 2) if hours else None,
+        "hours": hours,
+    }
+
+def report_range(report: str, month_num: int | None = None, year: int = 2025,
+                 start_date: date | None = None, end_date: date | None = None) -> tuple[date, date]:
+    """
+    The date range a daily, monthly or yearly report covers.
+
+    Parameters:
+     report (str): "daily", "monthly" or "yearly"
+     month_num (int | None): Month of a monthly report
+     year (int): Year of a monthly or yearly report
+     start_date (date | None): First day of a daily report
+     end_date (date | None): Last day of a daily report
+
+    Returns:
+     (tuple): first day, last day
+    """
+    if report == "daily":
+        return start_date, end_date
+    if report == "monthly":
+        return date(year, month_num, 1), date(year, month_num, calendar.monthrange(year, month_num)[1])
+    return date(year, 1, 1), date(year, 12, 31)
+
+def read_ranges(filename: str) -> Iterator[tuple[str, date, date]]:
+    """
+    Reads the date ranges of a batch lazily. Every line is id;start;end or
+    start;end (the line number is the id then). Empty lines, # comments and
+    a header line are skipped. Only a first line without any digits in its
+    start and end fields counts as the header, so a mistyped date in the
+    first range is reported instead of skipped.
+
+    Parameters:
+     filename (str): Name of the ranges file
+
+    Yields:
+     (tuple): range id, first day, last day
+    """
+    first = True
+    with open(filename, "r", encoding="utf-8") as f:
+        for number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            fields = [field.strip() for field in line.split(";")]
+            if len(fields) == 2:
+                fields.insert(0, str(number))
+            if len(fields) != 3:
+                raise ValueError(f"{filename}:{number}: expected id;start;end")
+            if first:
+                first = False
+                if not any(char.isdigit() for char in fields[1] + fields[2]):
+                    continue
+            try:
+                start_date = parse_date(fields[1])
+                end_date = parse_date(fields[2])
+            except ValueError:
+                raise ValueError(f"{filename}:{number}: invalid date") from None
+            if end_date < start_date:
+                raise ValueError(f"{filename}:{number}: end is before start")
+            yield fields[0], start_date, end_date
+
+def batch_totals(index: DailyIndex, ranges: Iterable[tuple[str, date, date]]) -> Iterator[tuple]:
+    """
+    Answers every range from the prefix sums of the index: two binary
+    searches per range, the hourly rows are never scanned again.
+
+    Parameters:
+     index (DailyIndex): Per-day prefix sums of the data
+     ranges (Iterable[tuple]): range id, first day, last day
+
+    Yields:
+     (tuple): range id, first day, last day, consumption, production, average temperature or None, hours
+    """
+    for range_id, start_date, end_date in ranges:
+        cons, prod, temp, hours = index.totals(start_date, end_date)
+        yield range_id, start_date, end_date, cons, prod, (temp / hours if hours else None), hours
+
+def write_batch_csv(results: Iterable[tuple], out: TextIO) -> int:
+    """
+    Writes batch results as a semicolon-separated, decimal-comma CSV like
+    the data file. Totals keep the three decimals of the data.
+
+    Parameters:
+     results (Iterable[tuple]): Rows from batch_totals
+     out (TextIO): Output stream
+
+    Returns:
+     (int): Number of ranges written
+    """
+    out.write("Id;Start;End;Consumption kWh;Production kWh;Average temperature;Hours\n")
+    count = 0
+    for range_id, start_date, end_date, cons, prod, temp, hours in results:
+        values = f"{cons:.3f};{prod:.3f};" + ("" if temp is None else f"{temp:.2f}")
+        out.write(
+            f"{range_id};{start_date.strftime('%d.%m.%Y')};{end_date.strftime('%d.%m.%Y')};"
+            + values.replace(".", ",") + f";{hours}\n"
+        )
+        count += 1
+    return count
+
+def run_batch(data_file: str, ranges_file: str, output_file: str | None = None, format: str = "csv") -> int:
+    """
+    Batch mode: answers all ranges of ranges_file with one load of the data.
+    All ranges are read and checked before the data is loaded or the
+    output is opened, so a bad range leaves no partial output behind.
+
+    Parameters:
+     data_file (str): Name of the hourly data file
+     ranges_file (str): Name of the ranges file (see read_ranges)
+     output_file (str | None): File to write, standard output when None
+     format (str): "json", CSV otherwise
+
+    Returns:
+     (int): Number of ranges answered
+
+    Raises:
+     ValueError: A line of the ranges file is not a valid range
+    """
+    ranges = list(read_ranges(ranges_file))
+    index = DailyIndex(read_data_cached(data_file))
+    results = batch_totals(index, ranges)
+    if format == "json":
+        # Exact thousandths like the CSV batch output
+        records = [
+            {"id": range_id, "start": start_date.isoformat(), "end": end_date.isoformat(),
+             "consumption_kwh": round(cons, VALUE_DECIMALS), "production_kwh": round(prod, VALUE_DECIMALS),
+             "average_temperature": None if temp is None else round(temp, 2), "hours": hours}
+            for range_id, start_date, end_date, cons, prod, temp, hours in results
+        ]
+        write_output(json.dumps(records, indent=2), output_file)
+        return len(records)
+    if output_file is None:
+        return write_batch_csv(results, sys.stdout)
+    with open(output_file, "w", encoding="utf-8") as f:
+        return write_batch_csv(results, f)
+
 def show_main_menu() -> str:
     """
     Prints the main menu and returns the user selection as a string.
@@ -83,12 +734,13 @@ def show_sub_menu(report: str) -> str:
 
     return selection
 
-def create_daily_report(data: list) -> list[str]:
+def create_daily_report(data, cache: ReportCache | None = None) -> str:
     """
-    Builds a daily report for a selected date range.
-    
+    Builds a daily report for a date range asked from the user.
+
     Parameters:
-     data (list): Consumption and production data + dates
+     data (list | EnergyColumns | DailyIndex): Consumption and production data + dates
+     cache (ReportCache | None): Reuse reports built before for the same range
 
     Returns:
      msg (str): printable string based on the date range
@@ -97,91 +749,43 @@ def create_daily_report(data: list) -> list[str]:
     start_date = datetime.strptime(start_date_str, "%d.%m.%Y").date()
     end_date_str = input("Enter end date (dd.mm.yyyy): ")
     end_date = datetime.strptime(end_date_str, "%d.%m.%Y").date()
-    cons = 0
-    prod = 0
-    temp = 0
-    i = 0
-    for per_hour in data:
-        if start_date <= per_hour[0].date() <= end_date:
-            cons += per_hour[1]
-            prod += per_hour[2]
-            temp += per_hour[3]
-            i += 1
-    msg = f"\nReport for the period {start_date_str}-{end_date_str}\n"
-    msg += f"- Total consumption: " + f"{cons:.2f}".replace(".", ",") + f" kWh\n"
-    msg += f"- Total production: " + f"{prod:.2f}".replace(".", ",") + f" kWh\n"
-    msg += f"- Average temperature: " + f"{(temp/i):.2f}".replace(".", ",") + f" °C\n"
-    return msg
+    # The header shows the dates as they were typed, e.g. 1.1.2025
+    period = f"{start_date_str}-{end_date_str}"
+    if cache is not None:
+        return cache.daily(data, start_date, end_date, period)
+    return build_daily_report(data, start_date, end_date, period)
 
-def create_monthly_report(data: list) -> list[str]:
+def create_monthly_report(data, cache: ReportCache | None = None) -> str:
     """
-    Builds a monthly summary report for a selected month.
+    Builds a monthly summary report for a month asked from the user.
 
     Parameters:
-     data (list): Consumption and production data + dates
+     data (list | EnergyColumns | DailyIndex): Consumption and production data + dates
+     cache (ReportCache | None): Reuse reports built before for the same month
 
     Returns:
      (str): Printable report for the selected month
     """
-    month_names = [
-        "", "January", "February", "March", "April", "May", "June",
-        "July", "August", "September", "October", "November", "December"
-    ]
     month_num = int(input("Enter month number (1–12): "))
-    cons = 0.0
-    prod = 0.0
-    temp = 0.0
-    i = 0
-    for per_hour in data:
-        if per_hour[0].month == month_num:
-            cons += per_hour[1]
-            prod += per_hour[2]
-            temp += per_hour[3]
-            i += 1
-    sep = "-----------------------------------------------------\n"
-    if i == 0:
-        avg_temp_str = "0,00"
-    else:
-        avg_temp_str = f"{(temp / i):.2f}".replace(".", ",")
-    msg = sep
-    msg += f"Report for the month: {month_names[month_num]}\n"
-    msg += f"- Total consumption: {f'{cons:.2f}'.replace('.', ',')} kWh\n"
-    msg += f"- Total production: {f'{prod:.2f}'.replace('.', ',')} kWh\n"
-    msg += f"- Average temperature: {avg_temp_str} °C\n"
-    return msg
+    if cache is not None:
+        return cache.monthly(data, month_num)
+    return build_monthly_report(data, month_num)
 
 
-def create_yearly_report(data: list) -> list[str]:
+def create_yearly_report(data, cache: ReportCache | None = None) -> str:
     """
     Builds a full-year summary report for 2025.
 
     Parameters:
-     data (list): Consumption and production data + dates
+     data (list | EnergyColumns | DailyIndex): Consumption and production data + dates
+     cache (ReportCache | None): Reuse the report built before
 
     Returns:
      (str): Printable report for the full year
     """
-    cons = 0.0
-    prod = 0.0
-    temp = 0.0
-    i = 0
-    for per_hour in data:
-        if per_hour[0].year == 2025:
-            cons += per_hour[1]
-            prod += per_hour[2]
-            temp += per_hour[3]
-            i += 1
-    sep = "-----------------------------------------------------\n"
-    if i == 0:
-        avg_temp_str = "0,00"
-    else:
-        avg_temp_str = f"{(temp / i):.2f}".replace(".", ",")
-    msg = sep
-    msg += "Report for the year: 2025\n"
-    msg += f"- Total consumption: {f'{cons:.2f}'.replace('.', ',')} kWh\n"
-    msg += f"- Total production: {f'{prod:.2f}'.replace('.', ',')} kWh\n"
-    msg += f"- Average temperature: {avg_temp_str} °C\n"
-    return msg
+    if cache is not None:
+        return cache.yearly(data, 2025)
+    return build_yearly_report(data, 2025)
 
 def print_report_to_console(lines: list[str]) -> None:
     """
@@ -202,12 +806,88 @@ def write_report_to_file(lines: list[str]) -> None:
     with open("report.txt", "w", encoding="utf-8") as f:
         f.write(lines)
 
-def main() -> None:
-    db = read_data("2025.csv")
+def parse_arguments(argv: list[str] | None = None) -> argparse.Namespace:
+    """
+    Reads the command line options. Without a report or ranges file the
+    interactive menu starts, as before. -o/--output names the output file
+    of both a report and a batch, e.g. task-f.py ranges.csv -o totals.csv
+
+    Parameters:
+     argv (list[str] | None): Arguments, sys.argv[1:] when None
+    """
+    parser = argparse.ArgumentParser(description="Energy consumption and production reports")
+    parser.add_argument("ranges", nargs="?", help="batch mode: file of id;start;end ranges (see read_ranges)")
+    parser.add_argument("-d", "--data", default="2025.csv", help="hourly energy CSV")
+    parser.add_argument("-o", "--output", help="output file of the report or the batch instead of the console")
+    parser.add_argument("-r", "--report", choices=["daily", "monthly", "yearly"], help="report to build")
+    parser.add_argument("--from", dest="start", type=argument_date, help="first day of a daily report")
+    parser.add_argument("--to", dest="end", type=argument_date, help="last day of a daily report")
+    parser.add_argument("--month", type=int, choices=range(1, 13), metavar="1-12", help="month of a monthly report")
+    parser.add_argument("--year", type=int, default=2025, help="year of a monthly or yearly report")
+    parser.add_argument("-f", "--format", choices=["text", "csv", "json"], default="text", help="output format")
+    args = parser.parse_args(argv)
+
+    if args.report == "daily" and (args.start is None or args.end is None):
+        parser.error("a daily report needs --from and --to")
+    if args.report == "daily" and args.end < args.start:
+        parser.error("--to is before --from")
+    if not 1 <= args.year <= 9999:
+        parser.error(f"invalid year: {args.year}")
+    if args.report == "monthly" and args.month is None:
+        parser.error("a monthly report needs --month")
+    if args.ranges and args.report:
+        parser.error("give either a ranges file or --report")
+    return args
+
+def write_output(content: str, output_file: str | None) -> None:
+    """Writes content to output_file, or prints it when None."""
+    if output_file is None:
+        print(content)
+        return
+    with open(output_file, "w", encoding="utf-8") as f:
+        f.write(content)
+
+def run_report(args: argparse.Namespace) -> None:
+    """
+    Builds the report given on the command line without asking anything.
+
+    Parameters:
+     args (argparse.Namespace): Options from parse_arguments
+    """
+    db = DailyIndex(read_data_cached(args.data))
+    start_date, end_date = report_range(args.report, args.month, args.year, args.start, args.end)
+    if args.format == "json":
+        content = json.dumps({"report": args.report, **report_totals(db, start_date, end_date)}, indent=2)
+    elif args.format == "csv":
+        out = io.StringIO()
+        write_batch_csv(batch_totals(db, [(args.report, start_date, end_date)]), out)
+        content = out.getvalue().rstrip("\n")
+    elif args.report == "daily":
+        content = build_daily_report(db, start_date, end_date)
+    elif args.report == "monthly":
+        content = build_monthly_report(db, args.month, args.year)
+    else:
+        content = build_yearly_report(db, args.year)
+    write_output(content, args.output)
+
+def main(argv: list[str] | None = None) -> None:
+    args = parse_arguments(argv)
+    if args.ranges:
+        try:
+            run_batch(args.data, args.ranges, args.output, args.format)
+        except ValueError as error:
+            sys.exit(f"error: {error}")
+        return
+    if args.report:
+        run_report(args)
+        return
+
+    db = DailyIndex(read_data_cached(args.data))
+    reports = ReportCache()
     while True:
         match show_main_menu():
             case "1":
-                daily_report = create_daily_report(db)
+                daily_report = create_daily_report(db, reports)
                 print_report_to_console(daily_report)
                 match show_sub_menu(daily_report):
                     case "1":
@@ -218,7 +898,7 @@ def main() -> None:
                         print("Thank you! Bye!")
                         break
             case "2":
-                monthly_report = create_monthly_report(db)
+                monthly_report = create_monthly_report(db, reports)
                 print_report_to_console(monthly_report)
                 match show_sub_menu(monthly_report):
                     case "1":
@@ -229,7 +909,7 @@ def main() -> None:
                         print("Thank you! Bye!")
                         break
             case "3":
-                yearly_report = create_yearly_report(db)
+                yearly_report = create_yearly_report(db, reports)
                 print_report_to_console(yearly_report)
                 match show_sub_menu(yearly_report):
                     case "1":
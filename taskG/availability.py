@@ -0,0 +1,132 @@
+# Copyright (c) 2026 Ville Heikkiniemi, Luka Hietala, Luukas Kola
+#
+# This code is licensed under the MIT License.
+# You are free to use, modify, and distribute this code,
+# provided that the original copyright notice is retained.
+#
+# See LICENSE file in the project root for full license information.
+
+"""
+Availability and double-booking checks for reserved resources
+
+Every resource has a list of (start, end, reservation_id) intervals
+sorted by start time. A reservation occupies
+[reservationDate + reservationTime, + durationHours).
+
+- is_free() looks only at intervals that start at most one longest
+  booking before the asked slot: a binary search plus the few overlaps
+- conflicts() finds every overlapping pair with a sweep over the sorted
+  intervals, O(n log n + number of conflicts)
+"""
+
+import heapq
+from bisect import bisect_left, insort
+from datetime import datetime, timedelta
+
+from reservation_index import start_of
+from task_g_class import Reservation
+
+
+def interval_of(reservation: Reservation) -> tuple[datetime, datetime]:
+    """
+    Returns the time a reservation occupies its resource
+
+    Parameters:
+     reservation (Reservation): Reservation
+
+    Returns:
+     (tuple): start, end (end excluded)
+    """
+    start = start_of(reservation)
+    return start, start + timedelta(hours=reservation.duration)
+
+
+class Availability:
+    """
+    Sorted interval lists per resource
+
+    Parameters:
+     reservations (Iterable[Reservation]): Initial reservations
+     confirmed_only (bool): Ignore reservations that are not confirmed
+    """
+
+    def __init__(self, reservations=(), confirmed_only: bool = False):
+        self.confirmed_only = confirmed_only
+        self.intervals = {}
+        self.longest = {}
+        for reservation in reservations:
+            self.add(reservation)
+
+    def add(self, reservation: Reservation) -> None:
+        if self.confirmed_only and not reservation.confirmed:
+            return
+        start, end = interval_of(reservation)
+        resource = reservation.resource
+        insort(self.intervals.setdefault(resource, []), (start, end, reservation.reservation_id))
+        self.longest[resource] = max(self.longest.get(resource, timedelta(0)), end - start)
+
+    def remove(self, reservation: Reservation) -> None:
+        if self.confirmed_only and not reservation.confirmed:
+            return
+        start, end = interval_of(reservation)
+        intervals = self.intervals[reservation.resource]
+        position = bisect_left(intervals, (start, end, reservation.reservation_id))
+        if position == len(intervals) or intervals[position][2] != reservation.reservation_id:
+            raise KeyError(reservation.reservation_id)
+        del intervals[position]
+
+    def overlapping(self, resource: str, start: datetime, end: datetime) -> list[int]:
+        """
+        Ids of reservations of a resource overlapping [start, end)
+
+        Parameters:
+         resource (str): Reserved resource
+         start (datetime): Start of the slot
+         end (datetime): End of the slot (excluded)
+
+        Returns:
+         (list[int]): Reservation ids ordered by start time
+        """
+        intervals = self.intervals.get(resource, [])
+        if not intervals:
+            return []
+        # Nothing starting more than the longest booking before the slot can reach it
+        first = bisect_left(intervals, (start - self.longest[resource],))
+        last = bisect_left(intervals, (end,))
+        return [key for begin, finish, key in intervals[first:last] if finish > start]
+
+    def is_free(self, resource: str, start: datetime, end: datetime) -> bool:
+        """
+        Tells whether a resource is free for the whole slot [start, end)
+
+        Parameters:
+         resource (str): Reserved resource, e.g. "Forest Area 1"
+         start (datetime): Start of the slot
+         end (datetime): End of the slot (excluded)
+
+        Returns:
+         (bool): True when no reservation overlaps the slot
+        """
+        return not self.overlapping(resource, start, end)
+
+    def conflicts(self, resource: str | None = None) -> list[tuple[str, int, int]]:
+        """
+        Finds every pair of overlapping reservations
+
+        Parameters:
+         resource (str | None): Only check this resource when given
+
+        Returns:
+         (list[tuple]): (resource, earlier id, later id) for each conflicting pair
+        """
+        resources = [resource] if resource is not None else sorted(self.intervals)
+        pairs = []
+        for name in resources:
+            active = []
+            for start, end, key in self.intervals.get(name, []):
+                while active and active[0][0] <= start:
+                    heapq.heappop(active)
+                for _, other in sorted(active, key=lambda item: item[1]):
+                    pairs.append((name, other, key))
+                heapq.heappush(active, (end, key))
+        return pairs
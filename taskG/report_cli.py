@@ -0,0 +1,109 @@
+# Copyright (c) 2026 Ville Heikkiniemi, Luka Hietala, Luukas Kola
+#
+# This code is licensed under the MIT License.
+# You are free to use, modify, and distribute this code,
+# provided that the original copyright notice is retained.
+#
+# See LICENSE file in the project root for full license information.
+
+"""
+Command line of the reservation report scripts (task_g_class.py and
+task_g_dict.py): input file, output file, selected reports, a date range
+and the output format. Without options the scripts print all reports of
+reservations.txt to the console, as before.
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import sys
+from collections.abc import Callable, Iterable, Iterator
+from datetime import date
+
+from report_engine import evaluate, fields_for, print_sections, stream_sections
+from report_output import ReportWriter
+
+# The date format of the command line is shared by all tasks (shared/date_arguments.py)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "shared"))
+from date_arguments import argument_date  # noqa: E402
+
+# Command line names of the report sections; section n is REPORT_NAMES[n - 1]
+REPORT_NAMES = ["confirmed", "long", "statuses", "summary", "revenue"]
+
+
+def parse_arguments(argv: list[str] | None = None) -> argparse.Namespace:
+    """
+    Reads the command line options
+
+    Parameters:
+     argv (list[str] | None): Arguments, sys.argv[1:] when None
+    """
+    parser = argparse.ArgumentParser(description="Prints reservation reports")
+    parser.add_argument("-i", "--input", default="reservations.txt", help="reservations file")
+    parser.add_argument("-o", "--output", help="output file instead of the console")
+    parser.add_argument("-r", "--report", action="append", choices=REPORT_NAMES,
+                        help="report to print, can be repeated (default: all)")
+    parser.add_argument("--from", dest="start", type=argument_date, help="first reservation date to include")
+    parser.add_argument("--to", dest="end", type=argument_date, help="last reservation date to include")
+    parser.add_argument("-f", "--format", choices=["text", "json"], default="text", help="output format")
+    parser.add_argument("--stream", action="store_true",
+                        help="read the file lazily and parse only the fields the reports need")
+    return parser.parse_args(argv)
+
+
+def within(reservations: Iterable, start: date | None, end: date | None, date_of: Callable) -> Iterator:
+    """
+    Keeps the reservations whose date is in the inclusive range
+
+    Parameters:
+     reservations (Iterable): Reservations
+     start (date | None): First date, unlimited when None
+     end (date | None): Last date, unlimited when None
+     date_of (Callable): reservation -> date
+    """
+    for reservation in reservations:
+        day = date_of(reservation)
+        if (start is None or day >= start) and (end is None or day <= end):
+            yield reservation
+
+
+def run(args: argparse.Namespace, fetch: Callable, iterate: Callable, report_sections: Callable,
+        reports: list, date_of: Callable) -> None:
+    """
+    Prints or writes the reports selected on the command line
+
+    Parameters:
+     args (argparse.Namespace): Options from parse_arguments
+     fetch (Callable): file -> all reservations
+     iterate (Callable): (file, fields) -> reservations, lazily
+     report_sections (Callable): selected numbers -> sections
+     reports (list): Report functions in section order (for their fields)
+     date_of (Callable): reservation -> date
+    """
+    names = args.report or REPORT_NAMES
+    selected = tuple(REPORT_NAMES.index(name) + 1 for name in names)
+    filtered = args.start is not None or args.end is not None
+
+    output = open(args.output, "w", encoding="utf-8") if args.output else contextlib.nullcontext(sys.stdout)
+    with output as out, contextlib.redirect_stdout(out):
+        if args.stream:
+            fields = fields_for(*(reports[number - 1] for number in selected))
+            reservations = iterate(args.input, fields | {"date"} if filtered else fields)
+        else:
+            reservations = fetch(args.input)
+        if filtered:
+            reservations = within(reservations, args.start, args.end, date_of)
+
+        sections = report_sections(selected)
+        if args.format == "json":
+            evaluate(reservations, sections)
+            json.dump({name: section.data() for name, section in zip(names, sections)},
+                      out, ensure_ascii=False, indent=2)
+            print()
+        elif args.stream:
+            with ReportWriter() as writer:
+                stream_sections(reservations, sections, writer.line)
+        else:
+            with ReportWriter() as writer:
+                print_sections(evaluate(reservations, sections), writer.line)
@@ -0,0 +1,220 @@
+# Copyright (c) 2026 Ville Heikkiniemi, Luka Hietala, Luukas Kola
+#
+# This code is licensed under the MIT License.
+# You are free to use, modify, and distribute this code,
+# provided that the original copyright notice is retained.
+#
+# See LICENSE file in the project root for full license information.
+
+"""
+Single-pass report engine for the reservation reports
+
+Every report section is an accumulator: it gets each reservation once
+through add() and produces its printable lines at the end. All sections
+are fed from the same loop, so the reservations are read only once and
+can just as well come from a generator reading the file.
+
+A section subclasses Section and implements add(), lines() and data(),
+so new sections can be plugged in without touching the engine.
+stream_sections prints while reading and buffers only what the output
+order forces it to. Report functions declare the fields they read with
+requires(), so loaders can skip parsing the rest.
+"""
+
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable
+
+
+def requires(*fields: str) -> Callable:
+    """
+    Declares which reservation fields a report function reads, so the
+    loader can parse only those (see fields_for)
+
+    Parameters:
+     fields (str): Field names
+    """
+    def decorate(function):
+        function.fields = frozenset(fields)
+        return function
+    return decorate
+
+
+def fields_for(*reports: Callable) -> frozenset:
+    """
+    Returns the union of the fields declared by report functions
+
+    Parameters:
+     reports (Callable): Functions decorated with requires()
+
+    Returns:
+     (frozenset): Field names the loader has to parse
+    """
+    return frozenset().union(*(report.fields for report in reports))
+
+
+class Section(ABC):
+    """Base class for report sections"""
+
+    def __init__(self, title: str):
+        self.title = title
+
+    @abstractmethod
+    def add(self, reservation) -> None:
+        """Takes one reservation into the section"""
+
+    @abstractmethod
+    def lines(self) -> list[str]:
+        """The printable lines, without the title"""
+
+    @abstractmethod
+    def data(self) -> dict:
+        """The result as JSON-ready data"""
+
+
+class ListSection(Section):
+    """
+    Prints one line for every reservation matching a condition
+
+    Parameters:
+     title (str): Section title
+     predicate (Callable): reservation -> bool
+     formatter (Callable): reservation -> str
+    """
+
+    def __init__(self, title: str, predicate: Callable, formatter: Callable):
+        super().__init__(title)
+        self.predicate = predicate
+        self.formatter = formatter
+        self.buffer = []
+        # When set, lines are written right away instead of buffered
+        self.emit = None
+
+    def add(self, reservation) -> None:
+        if self.predicate(reservation):
+            if self.emit is None:
+                self.buffer.append(self.formatter(reservation))
+            else:
+                self.emit(self.formatter(reservation))
+
+    def lines(self) -> list[str]:
+        return self.buffer
+
+    def data(self) -> dict:
+        return {"title": self.title, "count": len(self.buffer), "lines": self.buffer}
+
+
+class CountSection(Section):
+    """
+    Counts reservations matching and not matching a condition
+
+    Parameters:
+     title (str): Section title
+     predicate (Callable): reservation -> bool
+     formatter (Callable): (matching, not_matching) -> str
+    """
+
+    def __init__(self, title: str, predicate: Callable, formatter: Callable):
+        super().__init__(title)
+        self.predicate = predicate
+        self.formatter = formatter
+        self.matching = 0
+        self.not_matching = 0
+
+    def add(self, reservation) -> None:
+        if self.predicate(reservation):
+            self.matching += 1
+        else:
+            self.not_matching += 1
+
+    def lines(self) -> list[str]:
+        return [self.formatter(self.matching, self.not_matching)]
+
+    def data(self) -> dict:
+        return {"title": self.title, "matching": self.matching, "not_matching": self.not_matching}
+
+
+class TotalSection(Section):
+    """
+    Sums a value over all reservations
+
+    Parameters:
+     title (str): Section title
+     value (Callable): reservation -> number
+     formatter (Callable): total -> str
+    """
+
+    def __init__(self, title: str, value: Callable, formatter: Callable):
+        super().__init__(title)
+        self.value = value
+        self.formatter = formatter
+        self.total = 0
+
+    def add(self, reservation) -> None:
+        self.total += self.value(reservation)
+
+    def lines(self) -> list[str]:
+        return [self.formatter(self.total)]
+
+    def data(self) -> dict:
+        return {"title": self.title, "total": round(self.total, 2)}
+
+
+def evaluate(reservations: Iterable, sections: list[Section]) -> list[Section]:
+    """
+    Feeds every reservation to every section in a single pass
+
+    Parameters:
+     reservations (Iterable): Reservations, a list or a stream
+     sections (list[Section]): Report sections
+
+    Returns:
+     sections (list[Section]): The same sections, filled
+    """
+    for reservation in reservations:
+        for section in sections:
+            section.add(reservation)
+    return sections
+
+
+def print_sections(sections: list[Section], write: Callable = print) -> None:
+    """
+    Prints each section title followed by its lines
+
+    Parameters:
+     sections (list[Section]): Filled report sections
+     write (Callable): Output function for one line, e.g. ReportWriter.line
+    """
+    for section in sections:
+        write(section.title)
+        for line in section.lines():
+            write(line)
+
+
+def stream_sections(reservations: Iterable, sections: list[Section], write: Callable = print) -> None:
+    """
+    Prints the report while reading the reservations once. The first
+    section's lines are written as soon as they are produced. Later list
+    sections have to keep their lines until the pass ends, because they
+    are printed after it. Count and total sections only keep a number,
+    so e.g. long reservations + summary + revenue run in constant memory.
+
+    Parameters:
+     reservations (Iterable): Reservations, typically a generator over the file
+     sections (list[Section]): Report sections
+     write (Callable): Output function for one line
+    """
+    if not sections:
+        return
+    first = sections[0]
+    write(first.title)
+    if isinstance(first, ListSection):
+        first.emit = write
+    evaluate(reservations, sections)
+
+    if not isinstance(first, ListSection):
+        for line in first.lines():
+            write(line)
+    for section in sections[1:]:
+        write(section.title)
+        for line in section.lines():
+            write(line)
@@ -0,0 +1,71 @@
+# Copyright (c) 2026 Ville Heikkiniemi, Luka Hietala, Luukas Kola
+#
+# This code is licensed under the MIT License.
+# You are free to use, modify, and distribute this code,
+# provided that the original copyright notice is retained.
+#
+# See LICENSE file in the project root for full license information.
+
+"""
+Buffered report output
+
+ReportWriter collects report lines and writes them to any text stream
+in large chunks instead of one print (and one write call) per line.
+The Finnish date and time strings are cached per distinct value, since
+many reservations share the same day and start time. The bytes written
+are exactly what the print-based report functions wrote.
+"""
+
+import sys
+from datetime import date, time
+from functools import lru_cache
+from typing import TextIO
+
+
+@lru_cache(maxsize=4096)
+def format_day(day: date) -> str:
+    """Returns a date as dd.mm.yyyy"""
+    return day.strftime("%d.%m.%Y")
+
+
+@lru_cache(maxsize=1440)
+def format_time(start: time) -> str:
+    """Returns a time as hh.mm"""
+    return start.strftime("%H.%M")
+
+
+class ReportWriter:
+    """
+    Line writer with a large buffer
+
+    Parameters:
+     stream (TextIO | None): Target stream, sys.stdout at creation time by default
+     buffer_size (int): Characters collected before they are written
+    """
+
+    def __init__(self, stream: TextIO | None = None, buffer_size: int = 1 << 16):
+        self.stream = stream if stream is not None else sys.stdout
+        self.buffer_size = buffer_size
+        self.parts = []
+        self.size = 0
+
+    def line(self, text: str = "") -> None:
+        """Adds one line, like print(text)"""
+        self.parts.append(text)
+        self.parts.append("\n")
+        self.size += len(text) + 1
+        if self.size >= self.buffer_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Writes the buffered lines to the stream"""
+        if self.parts:
+            self.stream.write("".join(self.parts))
+            self.parts.clear()
+            self.size = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.flush()
@@ -0,0 +1,136 @@
+# Copyright (c) 2026 Ville Heikkiniemi, Luka Hietala, Luukas Kola
+#
+# This code is licensed under the MIT License.
+# You are free to use, modify, and distribute this code,
+# provided that the original copyright notice is retained.
+#
+# See LICENSE file in the project root for full license information.
+
+"""
+Reservation collection with running aggregates
+
+The confirmed and unconfirmed counts, the confirmed revenue and the
+revenue per resource are updated in O(1) whenever a reservation is
+added, removed, confirmed or unconfirmed, so reading them costs nothing.
+Revenue is kept in integer cents so that endless add/remove cycles
+do not accumulate float error.
+"""
+
+from task_g_class import Reservation, revenue_finnish
+
+
+def revenue_cents(reservation: Reservation) -> int:
+    """
+    Total price of a reservation in cents, whether confirmed or not
+
+    Parameters:
+     reservation (Reservation): Reservation
+
+    Returns:
+     (int): duration * price in cents
+    """
+    return reservation.duration * round(reservation.price * 100)
+
+
+class ReservationCollection:
+    """
+    Reservations by id together with their running aggregates
+
+    Attributes:
+     confirmed_count (int): Number of confirmed reservations
+     unconfirmed_count (int): Number of reservations not confirmed
+     confirmed_cents (int): Revenue from confirmed reservations in cents
+     resource_cents (dict[str, int]): Confirmed revenue in cents per resource
+    """
+
+    def __init__(self, reservations=()):
+        self.reservations = {}
+        self.confirmed_count = 0
+        self.unconfirmed_count = 0
+        self.confirmed_cents = 0
+        self.resource_cents = {}
+        for reservation in reservations:
+            self.add(reservation)
+
+    def __len__(self):
+        return len(self.reservations)
+
+    def __iter__(self):
+        return iter(self.reservations.values())
+
+    def __contains__(self, reservation_id):
+        return reservation_id in self.reservations
+
+    def _count(self, reservation: Reservation, sign: int) -> None:
+        """Adds (sign 1) or takes away (sign -1) a reservation from the aggregates"""
+        if reservation.confirmed:
+            self.confirmed_count += sign
+            cents = sign * revenue_cents(reservation)
+            self.confirmed_cents += cents
+            resource = reservation.resource
+            self.resource_cents[resource] = self.resource_cents.get(resource, 0) + cents
+        else:
+            self.unconfirmed_count += sign
+
+    def add(self, reservation: Reservation) -> None:
+        """
+        Adds a reservation
+
+        Parameters:
+         reservation (Reservation): Reservation with a unique reservation_id
+        """
+        if reservation.reservation_id in self.reservations:
+            raise ValueError(f"reservation {reservation.reservation_id} already exists")
+        self.reservations[reservation.reservation_id] = reservation
+        self._count(reservation, 1)
+
+    def remove(self, reservation_id: int) -> Reservation:
+        """
+        Removes a reservation
+
+        Parameters:
+         reservation_id (int): Id of the reservation
+
+        Returns:
+         reservation (Reservation): The removed reservation
+        """
+        reservation = self.reservations.pop(reservation_id)
+        self._count(reservation, -1)
+        return reservation
+
+    def set_confirmed(self, reservation_id: int, confirmed: bool = True) -> None:
+        """
+        Confirms or unconfirms a reservation
+
+        Parameters:
+         reservation_id (int): Id of the reservation
+         confirmed (bool): New confirmation state
+        """
+        reservation = self.reservations[reservation_id]
+        if reservation.confirmed == confirmed:
+            return
+        self._count(reservation, -1)
+        reservation.confirmed = confirmed
+        self._count(reservation, 1)
+
+    def confirm(self, reservation_id: int) -> None:
+        self.set_confirmed(reservation_id, True)
+
+    def unconfirm(self, reservation_id: int) -> None:
+        self.set_confirmed(reservation_id, False)
+
+    def total_revenue(self) -> float:
+        """Revenue from confirmed reservations"""
+        return self.confirmed_cents / 100
+
+    def resource_revenue(self, resource: str) -> float:
+        """Revenue from confirmed reservations of one resource"""
+        return self.resource_cents.get(resource, 0) / 100
+
+    def print_confirmation_summary(self) -> None:
+        """Prints the same lines as task_g_class.confirmation_summary"""
+        print(f'- Confirmed reservations: {self.confirmed_count} pcs\n- Not confirmed reservations: {self.unconfirmed_count} pcs')
+
+    def print_total_revenue(self) -> None:
+        """Prints the same line as task_g_class.total_revenue"""
+        print(f'Total revenue from confirmed reservations: {revenue_finnish(self.total_revenue())}')
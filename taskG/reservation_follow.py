@@ -0,0 +1,153 @@
+# Copyright (c) 2026 Ville Heikkiniemi, Luka Hietala, Luukas Kola
+#
+# This code is licensed under the MIT License.
+# You are free to use, modify, and distribute this code,
+# provided that the original copyright notice is retained.
+#
+# See LICENSE file in the project root for full license information.
+
+"""
+Follow mode for reservations.txt, like tail -f
+
+The follower remembers the byte offset it has read up to and on every
+poll parses only what was appended after it. New reservations are pushed
+into a ReservationCollection (and optionally report sections), so the
+aggregates stay current without ever re-reading the whole file.
+
+The files have no newline after the last record, so an unterminated
+last line is taken in once it is a complete record (11 fields and a full
+createdAt timestamp); anything shorter is left for the next poll.
+
+A line that cannot be parsed or repeats a known reservation id is
+skipped on its own and handed to on_error; the rest of the chunk is
+still taken in and following goes on.
+"""
+
+import os
+import sys
+import time
+from collections.abc import Callable
+
+from reservation_collection import ReservationCollection
+from task_g_class import Reservation
+
+FIELD_COUNT = 11
+CREATED_LENGTH = len("2025-08-12 14:33:20")
+
+
+def is_complete(fields: list[str]) -> bool:
+    """Tells whether the fields of an unterminated line form a whole record"""
+    return len(fields) == FIELD_COUNT and len(fields[10].strip()) == CREATED_LENGTH
+
+
+class ReservationFollower:
+    """
+    Incremental reader of an append-only reservations file
+
+    Parameters:
+     path (str): Reservations file
+     collection (ReservationCollection | None): Receives new reservations
+     sections (list | None): Report sections (report_engine) that also receive them
+     on_error (Callable | None): Called with (line, error) for every skipped line
+
+    Attributes:
+     skipped (int): Number of lines skipped so far
+    """
+
+    def __init__(self, path: str, collection: ReservationCollection | None = None, sections: list | None = None,
+                 on_error: Callable[[bytes, Exception], None] | None = None):
+        self.path = path
+        self.collection = collection if collection is not None else ReservationCollection()
+        self.sections = sections or []
+        self.on_error = on_error
+        self.skipped = 0
+        self.offset = 0
+        self.pending = b""
+
+    def poll(self) -> list[Reservation]:
+        """
+        Reads whatever was appended since the last poll
+
+        Returns:
+         (list[Reservation]): Reservations added by this poll
+        """
+        size = os.path.getsize(self.path)
+        if size < self.offset:
+            # The file was truncated or replaced: start over from its beginning
+            self.offset = 0
+            self.pending = b""
+        if size == self.offset:
+            return []
+
+        with open(self.path, "rb") as f:
+            f.seek(self.offset)
+            data = f.read(size - self.offset)
+        self.offset += len(data)
+
+        lines = (self.pending + data).split(b"\n")
+        self.pending = lines.pop()
+        if self.pending:
+            # A write can stop in the middle of a multi-byte character
+            fields = self.pending.decode("utf-8", errors="replace").split("|")
+            if is_complete(fields):
+                lines.append(self.pending)
+                self.pending = b""
+
+        added = []
+        for line in lines:
+            if len(line) <= 1:
+                continue
+            try:
+                # UnicodeDecodeError is a ValueError too
+                reservation = Reservation(line.decode("utf-8").split("|"))
+                self.collection.add(reservation)
+            except (ValueError, IndexError) as error:
+                self.skipped += 1
+                if self.on_error is not None:
+                    self.on_error(line, error)
+                continue
+            for section in self.sections:
+                section.add(reservation)
+            added.append(reservation)
+        return added
+
+    def follow(self, interval: float = 1.0, on_new=None, stop=None) -> None:
+        """
+        Polls the file until stop() returns True (forever by default)
+
+        Parameters:
+         interval (float): Seconds between polls
+         on_new (Callable | None): Called with the list of new reservations
+         stop (Callable | None): Returns True when following should end
+        """
+        while stop is None or not stop():
+            added = self.poll()
+            if added and on_new is not None:
+                on_new(added)
+            time.sleep(interval)
+
+
+def main():
+    """
+    Follows a reservations file and prints the summary and revenue
+    every time new reservations arrive
+    """
+    path = sys.argv[1] if len(sys.argv) > 1 else "reservations.txt"
+
+    def report_skipped(line, error):
+        print(f"skipped line: {error}: {line[:80]!r}", file=sys.stderr)
+
+    follower = ReservationFollower(path, on_error=report_skipped)
+
+    def print_aggregates(added):
+        print(f"{len(added)} new reservations")
+        follower.collection.print_confirmation_summary()
+        follower.collection.print_total_revenue()
+
+    try:
+        follower.follow(on_new=print_aggregates)
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
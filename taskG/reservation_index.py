@@ -0,0 +1,142 @@
+# Copyright (c) 2026 Ville Heikkiniemi, Luka Hietala, Luukas Kola
+#
+# This code is licensed under the MIT License.
+# You are free to use, modify, and distribute this code,
+# provided that the original copyright notice is retained.
+#
+# See LICENSE file in the project root for full license information.
+
+"""
+In-memory secondary indexes over Reservation objects
+
+- hash index on reservedResource
+- hash index on the confirmed flag
+- sorted index on the start time (reservationDate + reservationTime),
+  both over all reservations and per resource
+
+Lookups by resource or confirmation state are dictionary lookups and
+time ranges are two binary searches, so queries like "all bookings for
+Red Room next week" do not scan every reservation.
+"""
+
+from bisect import bisect_left, insort
+from datetime import datetime
+
+from task_g_class import Reservation, fetch_reservations
+
+
+def start_of(reservation: Reservation) -> datetime:
+    """
+    Returns the start time of a reservation
+
+    Parameters:
+     reservation (Reservation): Reservation
+
+    Returns:
+     (datetime): reservation date + reservation time
+    """
+    return datetime.combine(reservation.date, reservation.time)
+
+
+class ReservationIndex:
+    """
+    Reservations indexed by id, resource, confirmation state and start time.
+    The indexes are updated by add() and remove().
+    """
+
+    def __init__(self, reservations=()):
+        self.by_id = {}
+        self.by_resource = {}
+        self.by_confirmed = {True: {}, False: {}}
+        self.by_start = []
+        self.by_resource_start = {}
+        for reservation in reservations:
+            self.add(reservation)
+
+    @classmethod
+    def from_file(cls, reservations_file: str) -> "ReservationIndex":
+        """
+        Builds an index from a reservations file
+
+        Parameters:
+         reservations_file (str): Name of the file containing the reservations
+        """
+        return cls(fetch_reservations(reservations_file))
+
+    def __len__(self):
+        return len(self.by_id)
+
+    def __contains__(self, reservation_id):
+        return reservation_id in self.by_id
+
+    def add(self, reservation: Reservation) -> None:
+        """
+        Adds a reservation to every index
+
+        Parameters:
+         reservation (Reservation): Reservation with a unique reservation_id
+        """
+        key = reservation.reservation_id
+        if key in self.by_id:
+            raise ValueError(f"reservation {key} is already indexed")
+        self.by_id[key] = reservation
+        self.by_resource.setdefault(reservation.resource, {})[key] = reservation
+        self.by_confirmed[reservation.confirmed][key] = reservation
+        entry = (start_of(reservation), key)
+        insort(self.by_start, entry)
+        insort(self.by_resource_start.setdefault(reservation.resource, []), entry)
+
+    def remove(self, reservation_id: int) -> Reservation:
+        """
+        Removes a reservation from every index
+
+        Parameters:
+         reservation_id (int): Id of the reservation
+
+        Returns:
+         reservation (Reservation): The removed reservation
+        """
+        reservation = self.by_id.pop(reservation_id)
+        resource = reservation.resource
+        del self.by_resource[resource][reservation_id]
+        if not self.by_resource[resource]:
+            del self.by_resource[resource]
+        del self.by_confirmed[reservation.confirmed][reservation_id]
+        entry = (start_of(reservation), reservation_id)
+        del self.by_start[bisect_left(self.by_start, entry)]
+        resource_starts = self.by_resource_start[resource]
+        del resource_starts[bisect_left(resource_starts, entry)]
+        if not resource_starts:
+            del self.by_resource_start[resource]
+        return reservation
+
+    def get(self, reservation_id: int) -> Reservation | None:
+        return self.by_id.get(reservation_id)
+
+    def for_resource(self, resource: str) -> list[Reservation]:
+        """Reservations of one resource, in insertion order"""
+        return list(self.by_resource.get(resource, {}).values())
+
+    def with_confirmed(self, confirmed: bool = True) -> list[Reservation]:
+        """Confirmed (or, with False, unconfirmed) reservations, in insertion order"""
+        return list(self.by_confirmed[confirmed].values())
+
+    def between(self, start: datetime, end: datetime, resource: str | None = None) -> list[Reservation]:
+        """
+        Reservations starting in [start, end), ordered by start time
+
+        Parameters:
+         start (datetime): First start time included
+         end (datetime): First start time excluded
+         resource (str | None): Only this resource when given
+
+        Returns:
+         (list[Reservation]): Matching reservations
+        """
+        if resource is None:
+            entries = self.by_start
+        else:
+            entries = self.by_resource_start.get(resource, [])
+        first = bisect_left(entries, (start,))
+        last = bisect_left(entries, (end,))
+        return [self.by_id[key] for _, key in entries[first:last]]
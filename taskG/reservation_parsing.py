@@ -0,0 +1,61 @@
+# Copyright (c) 2026 Ville Heikkiniemi, Luka Hietala, Luukas Kola
+#
+# This code is licensed under the MIT License.
+# You are free to use, modify, and distribute this code,
+# provided that the original copyright notice is retained.
+#
+# See LICENSE file in the project root for full license information.
+
+"""
+Fixed-format parsers for the date and time fields of reservations.txt
+
+The fields always look like YYYY-MM-DD, HH:MM and YYYY-MM-DD HH:MM:SS,
+so the C-level fromisoformat constructors can be used instead of
+datetime.strptime and its locale/regex machinery. Dates and start
+times repeat a lot between bookings, so they are cached.
+"""
+
+from datetime import date, datetime, time
+from functools import lru_cache
+
+
+@lru_cache(maxsize=4096)
+def parse_date(text: str) -> date:
+    """
+    Parses a YYYY-MM-DD date
+
+    Parameters:
+     text (str): Date field
+
+    Returns:
+     (date): Parsed date
+    """
+    return date.fromisoformat(text)
+
+
+@lru_cache(maxsize=1440)
+def parse_time(text: str) -> time:
+    """
+    Parses a HH:MM start time
+
+    Parameters:
+     text (str): Time field
+
+    Returns:
+     (time): Parsed time
+    """
+    return time.fromisoformat(text)
+
+
+def parse_datetime(text: str) -> datetime:
+    """
+    Parses a YYYY-MM-DD HH:MM:SS timestamp. Creation times are nearly
+    unique, so they are not cached.
+
+    Parameters:
+     text (str): Timestamp field, surrounding whitespace allowed
+
+    Returns:
+     (datetime): Parsed timestamp
+    """
+    return datetime.fromisoformat(text.strip())
@@ -20,21 +20,65 @@ int | str | str | str | date | time | int | float | bool | str | datetime
 
 """
 
-from datetime import datetime
+from array import array
+from collections.abc import Iterator
+from datetime import datetime, date, time, timedelta
+from functools import lru_cache
+
+from reservation_parsing import parse_date, parse_datetime, parse_time
+from report_output import ReportWriter, format_day, format_time
+from report_cli import parse_arguments, run
+from report_engine import (
+    CountSection, ListSection, TotalSection, fields_for, requires, stream_sections,
+)
+
+EPOCH = datetime(1970, 1, 1)
+
+# Column in the file and converter of every Reservation field, for projected loading
+FIELD_PARSERS = {
+    "reservation_id": (0, int),
+    "name": (1, str),
+    "email": (2, str),
+    "phone": (3, str),
+    "date": (4, parse_date),
+    "time": (5, parse_time),
+    "duration": (6, int),
+    "price": (7, float),
+    "confirmed": (8, lambda text: text.strip() == 'True'),
+    "resource": (9, str),
+    "created": (10, lambda text: parse_datetime(str(text))),
+}
+
+@lru_cache(maxsize=64)
+def projection(fields: frozenset) -> tuple:
+    """Returns (name, column, converter) for each field of a projected load"""
+    return tuple((name, *FIELD_PARSERS[name]) for name in sorted(fields))
 
 class Reservation:
-    def __init__(self, data):
+    __slots__ = (
+        "reservation_id", "name", "email", "phone", "date", "time",
+        "duration", "price", "confirmed", "resource", "created",
+    )
+
+    def __init__(self, data, fields=None):
+        if fields is not None:
+            # Projected load: parse only the given fields. The others stay
+            # unset, so a report reading a field it did not declare fails loudly.
+            for name, column, convert in projection(fields):
+                setattr(self, name, convert(data[column]))
+            return
+
         self.reservation_id = int(data[0])
         self.name = str(data[1])
         self.email = str(data[2])
         self.phone = str(data[3])
-        self.date = datetime.strptime(data[4], "%Y-%m-%d").date()
-        self.time = datetime.strptime(data[5], "%H:%M").time()
+        self.date = parse_date(data[4])
+        self.time = parse_time(data[5])
         self.duration = int(data[6])
         self.price = float(data[7])
         self.confirmed = (True if data[8].strip() == 'True' else False)
         self.resource = str(data[9])
-        self.created = datetime.strptime(str(data[10]).strip(), "%Y-%m-%d %H:%M:%S")
+        self.created = parse_datetime(str(data[10]))
 
     def is_confirmed(self):
         return self.confirmed
@@ -46,15 +90,123 @@ class Reservation:
         return self.duration * self.price
     
     def finnish_day(self):
-        return self.date.strftime("%d.%m.%Y")
+        return format_day(self.date)
     
     def finnish_time(self):
-        return self.time.strftime("%H.%M")
+        return format_time(self.time)
 
     def revenue(self):
         revenue = self.total_price() if self.confirmed else 0
         return revenue
-    
+
+
+class ReservationTable:
+    """
+    Compact struct-of-arrays store for many reservations. Numbers live in
+    typed arrays, dates as ordinals, times as minutes after midnight and
+    creation times as seconds since 1970. Repeated resource names share
+    one string object.
+
+    Indexing or iterating gives ReservationRow views, which have the same
+    API as Reservation, so the report functions accept a table as is.
+    """
+
+    def __init__(self, reservations=()):
+        self.ids = array("q")
+        self.durations = array("l")
+        self.prices = array("d")
+        self.confirmed = array("b")
+        self.dates = array("l")
+        self.times = array("h")
+        self.created = array("q")
+        self.names = []
+        self.emails = []
+        self.phones = []
+        self.resources = []
+        self._resource_names = {}
+        for reservation in reservations:
+            self.append(reservation)
+
+    def append(self, reservation: Reservation) -> None:
+        self.ids.append(reservation.reservation_id)
+        self.durations.append(reservation.duration)
+        self.prices.append(reservation.price)
+        self.confirmed.append(reservation.confirmed)
+        self.dates.append(reservation.date.toordinal())
+        self.times.append(reservation.time.hour * 60 + reservation.time.minute)
+        self.created.append(int((reservation.created - EPOCH).total_seconds()))
+        self.names.append(reservation.name)
+        self.emails.append(reservation.email)
+        self.phones.append(reservation.phone)
+        resource = self._resource_names.setdefault(reservation.resource, reservation.resource)
+        self.resources.append(resource)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("reservation index out of range")
+        return ReservationRow(self, index)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield ReservationRow(self, index)
+
+    def is_confirmed(self, index):
+        return bool(self.confirmed[index])
+
+    def is_long(self, index):
+        return self.durations[index] >= 3
+
+    def total_price(self, index):
+        return self.durations[index] * self.prices[index]
+
+    def revenue(self, index):
+        return self.total_price(index) if self.confirmed[index] else 0
+
+    def total_revenue(self):
+        return sum(
+            duration * price
+            for duration, price, confirmed in zip(self.durations, self.prices, self.confirmed)
+            if confirmed
+        )
+
+
+class ReservationRow:
+    """
+    Read-only view of one row of a ReservationTable, with the same API as
+    Reservation. The fields are looked up from the table on access, so a
+    row holds only its two slots: the table and the row number.
+    """
+    __slots__ = ("table", "row")
+
+    def __init__(self, table: ReservationTable, row: int):
+        self.table = table
+        self.row = row
+
+    reservation_id = property(lambda self: self.table.ids[self.row])
+    name = property(lambda self: self.table.names[self.row])
+    email = property(lambda self: self.table.emails[self.row])
+    phone = property(lambda self: self.table.phones[self.row])
+    date = property(lambda self: date.fromordinal(self.table.dates[self.row]))
+    time = property(lambda self: time(*divmod(self.table.times[self.row], 60)))
+    duration = property(lambda self: self.table.durations[self.row])
+    price = property(lambda self: self.table.prices[self.row])
+    confirmed = property(lambda self: bool(self.table.confirmed[self.row]))
+    resource = property(lambda self: self.table.resources[self.row])
+    created = property(lambda self: EPOCH + timedelta(seconds=self.table.created[self.row]))
+
+    # The methods of Reservation work unchanged on the properties
+    is_confirmed = Reservation.is_confirmed
+    is_long = Reservation.is_long
+    total_price = Reservation.total_price
+    finnish_day = Reservation.finnish_day
+    finnish_time = Reservation.finnish_time
+    revenue = Reservation.revenue
+
 
 def revenue_finnish(revenue_total: float) -> str:
     """
@@ -68,13 +220,14 @@ def revenue_finnish(revenue_total: float) -> str:
     """
     return f'{revenue_total:.2f} €'.replace('.', ',')
 
-def fetch_reservations(reservations_file: str) -> list[list]:
+def fetch_reservations(reservations_file: str, fields=None) -> list[list]:
     """
     Reads reservations from a file and returns the reservations converted
     You don't need to modify this function!
 
     Parameters:
      reservation_file (str): Name of the file containing the reservations
+     fields (frozenset | None): Only parse these fields (see fields_for), None for all
 
     Returns:
      reservations (list): Read and converted reservations
@@ -83,46 +236,89 @@ def fetch_reservations(reservations_file: str) -> list[list]:
     with open(reservations_file, "r", encoding="utf-8") as f:
         for line in f:
             if len(line) > 1:
-                fields = line.split("|")
-                reservations.append(Reservation(fields))
+                data = line.split("|")
+                reservations.append(Reservation(data, fields))
     return reservations
 
-def confirmed_reservations(reservations: list[Reservation]) -> None:
+def iter_reservations(reservations_file: str, fields=None) -> Iterator[Reservation]:
+    """
+    Reads reservations from a file one at a time
+
+    Parameters:
+     reservations_file (str): Name of the file containing the reservations
+     fields (frozenset | None): Only parse these fields (see fields_for), None for all
+
+    Yields:
+     reservation (Reservation): Next converted reservation
+    """
+    with open(reservations_file, "r", encoding="utf-8") as f:
+        for line in f:
+            if len(line) > 1:
+                yield Reservation(line.split("|"), fields)
+
+def fetch_reservation_table(reservations_file: str) -> ReservationTable:
+    """
+    Reads reservations from a file into a compact ReservationTable
+
+    Parameters:
+     reservations_file (str): Name of the file containing the reservations
+
+    Returns:
+     table (ReservationTable): Read and converted reservations
+    """
+    table = ReservationTable()
+    with open(reservations_file, "r", encoding="utf-8") as f:
+        for line in f:
+            if len(line) > 1:
+                table.append(Reservation(line.split("|")))
+    return table
+
+@requires("confirmed", "name", "resource", "date", "time")
+def confirmed_reservations(reservations: list[Reservation], out: ReportWriter | None = None) -> None:
     """
     Print confirmed reservations
 
     Parameters:
      reservations (list[Reservations]): Reservations
+     out (ReportWriter | None): Buffered output, standard output when None
     """
-    for reservation in reservations:
-        if reservation.is_confirmed():
-            print(f'- {reservation.name}, {reservation.resource}, {reservation.finnish_day()} at {reservation.finnish_time()}')
+    with out or ReportWriter() as writer:
+        for reservation in reservations:
+            if reservation.is_confirmed():
+                writer.line(f'- {reservation.name}, {reservation.resource}, {reservation.finnish_day()} at {reservation.finnish_time()}')
 
-def long_reservations(reservations : list[Reservation]) -> None:
+@requires("duration", "name", "date", "time", "resource")
+def long_reservations(reservations : list[Reservation], out: ReportWriter | None = None) -> None:
     """
     Print long reservations
 
     Parameters:
      reservations (list[Reservation]): Reservations
+     out (ReportWriter | None): Buffered output, standard output when None
     """
-    for reservation in reservations:
-        if reservation.is_long():
-            print(f'- {reservation.name}, {reservation.finnish_day()} at {reservation.finnish_time()}, duration {reservation.duration} h, {reservation.resource}')
+    with out or ReportWriter() as writer:
+        for reservation in reservations:
+            if reservation.is_long():
+                writer.line(f'- {reservation.name}, {reservation.finnish_day()} at {reservation.finnish_time()}, duration {reservation.duration} h, {reservation.resource}')
 
 
-def confirmation_statuses(reservations: list[Reservation]) -> None:
+@requires("name", "confirmed")
+def confirmation_statuses(reservations: list[Reservation], out: ReportWriter | None = None) -> None:
     """
     Print confirmation statuses
 
     Parameters:
      reservations (list[Reservation]): Reservations
+     out (ReportWriter | None): Buffered output, standard output when None
     """
-    for reservation in reservations:
-        name : str = reservation.name
-        confirmed : bool = reservation.confirmed
+    with out or ReportWriter() as writer:
+        for reservation in reservations:
+            name : str = reservation.name
+            confirmed : bool = reservation.confirmed
 
-        print(f'{name} → {"Confirmed" if confirmed else "NOT Confirmed"}')
+            writer.line(f'{name} → {"Confirmed" if confirmed else "NOT Confirmed"}')
 
+@requires("confirmed")
 def confirmation_summary(reservations: list[Reservation]) -> None:
     """
     Print confirmation summary
@@ -133,6 +329,7 @@ def confirmation_summary(reservations: list[Reservation]) -> None:
     confirmed : int = len([x for x in reservations if x.confirmed])
     print(f'- Confirmed reservations: {confirmed} pcs\n- Not confirmed reservations: {len(reservations) - confirmed} pcs')
 
+@requires("duration", "price", "confirmed")
 def total_revenue(reservations: list[Reservation]) -> None:
     """
     Print total revenue
@@ -146,22 +343,77 @@ def total_revenue(reservations: list[Reservation]) -> None:
 
     print(f'Total revenue from confirmed reservations: {revenue_finnish(total)}')
 
-def main():
+# Report functions in section order; section n is REPORTS[n - 1]
+REPORTS = [
+    confirmed_reservations,
+    long_reservations,
+    confirmation_statuses,
+    confirmation_summary,
+    total_revenue,
+]
+
+def report_sections(selected: tuple = (1, 2, 3, 4, 5)) -> list:
+    """
+    The report sections as single-pass accumulators, producing the
+    same output as the report functions above.
+
+    Parameters:
+     selected (tuple): Section numbers to include, in output order
+
+    Returns:
+     (list): Sections for report_engine.evaluate
+    """
+    sections = [
+        ListSection(
+            "1) Confirmed Reservations",
+            Reservation.is_confirmed,
+            lambda r: f'- {r.name}, {r.resource}, {r.finnish_day()} at {r.finnish_time()}',
+        ),
+        ListSection(
+            "2) Long Reservations (≥ 3 h)",
+            Reservation.is_long,
+            lambda r: f'- {r.name}, {r.finnish_day()} at {r.finnish_time()}, duration {r.duration} h, {r.resource}',
+        ),
+        ListSection(
+            "3) Reservation Confirmation Status",
+            lambda r: True,
+            lambda r: f'{r.name} → {"Confirmed" if r.confirmed else "NOT Confirmed"}',
+        ),
+        CountSection(
+            "4) Confirmation Summary",
+            Reservation.is_confirmed,
+            lambda confirmed, not_confirmed: f'- Confirmed reservations: {confirmed} pcs\n- Not confirmed reservations: {not_confirmed} pcs',
+        ),
+        TotalSection(
+            "5) Total Revenue from Confirmed Reservations",
+            Reservation.revenue,
+            lambda total: f'Total revenue from confirmed reservations: {revenue_finnish(total)}',
+        ),
+    ]
+    return [sections[number - 1] for number in selected]
+
+def stream_report(reservation_file: str, selected: tuple = (2, 4, 5)) -> None:
+    """
+    Prints the selected report sections straight from the file without
+    loading all reservations. The default long reservations, summary
+    and revenue sections run in constant memory. Only the fields the
+    selected reports need are parsed.
+
+    Parameters:
+     reservation_file (str): Name of the file containing the reservations
+     selected (tuple): Section numbers to include, in output order
+    """
+    fields = fields_for(*(REPORTS[number - 1] for number in selected))
+    with ReportWriter() as out:
+        stream_sections(iter_reservations(reservation_file, fields), report_sections(selected), out.line)
+
+def main(argv: list[str] | None = None):
     """
     Prints reservation information according to requirements
-    Reservation-specific printing is done in functions
-    """
-    reservations = fetch_reservations("reservations.txt")
-    print("1) Confirmed Reservations")
-    confirmed_reservations(reservations)
-    print("2) Long Reservations (≥ 3 h)")
-    long_reservations(reservations)
-    print("3) Reservation Confirmation Status")
-    confirmation_statuses(reservations)
-    print("4) Confirmation Summary")
-    confirmation_summary(reservations)
-    print("5) Total Revenue from Confirmed Reservations")
-    total_revenue(reservations)
+    All report sections are filled in one pass over the reservations
+    The command line options are described in report_cli
+    """
+    run(parse_arguments(argv), fetch_reservations, iter_reservations, report_sections, REPORTS, lambda r: r.date)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
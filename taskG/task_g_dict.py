@@ -20,40 +20,66 @@ int | str | str | str | date | time | int | float | bool | str | datetime
 
 """
 
-from datetime import datetime
+from collections.abc import Iterator
 
+from reservation_parsing import parse_date, parse_datetime, parse_time
+from report_output import ReportWriter, format_day, format_time
+from report_cli import parse_arguments, run
+from report_engine import (
+    CountSection, ListSection, TotalSection, fields_for, requires, stream_sections,
+)
 
-def convert_reservation(data: list[str]) -> dict:
+# Column in the file and converter of every key, for projected loading
+FIELD_PARSERS = {
+    "id": (0, int),
+    "name": (1, str),
+    "email": (2, str),
+    "phone": (3, str),
+    "date": (4, parse_date),
+    "time": (5, parse_time),
+    "duration": (6, int),
+    "price": (7, float),
+    "confirmed": (8, lambda text: text.strip() == "True"),
+    "resource": (9, str),
+    "created": (10, parse_datetime),
+}
+
+
+def convert_reservation(data: list[str], fields=None) -> dict:
     """
     Convert raw string data into a reservation dictionary.
 
     Parameters:
      data (list[str]): Unconverted reservation -> 11 columns
+     fields (frozenset | None): Only convert these keys (see fields_for), None for all
 
     Returns:
      dict: Converted reservation with named fields
     """
+    if fields is not None:
+        return {name: FIELD_PARSERS[name][1](data[FIELD_PARSERS[name][0]]) for name in fields}
     return {
         "id": int(data[0]),
         "name": data[1],
         "email": data[2],
         "phone": data[3],
-        "date": datetime.strptime(data[4], "%Y-%m-%d").date(),
-        "time": datetime.strptime(data[5], "%H:%M").time(),
+        "date": parse_date(data[4]),
+        "time": parse_time(data[5]),
         "duration": int(data[6]),
         "price": float(data[7]),
         "confirmed": True if data[8].strip() == "True" else False,
         "resource": data[9],
-        "created": datetime.strptime(data[10].strip(), "%Y-%m-%d %H:%M:%S"),
+        "created": parse_datetime(data[10]),
     }
 
 
-def fetch_reservations(reservation_file: str) -> list[dict]:
+def fetch_reservations(reservation_file: str, fields=None) -> list[dict]:
     """
     Reads reservations from a file and returns them as dictionaries.
 
     Parameters:
      reservation_file (str): Name of the file containing the reservations
+     fields (frozenset | None): Only convert these keys, None for all
 
     Returns:
      list[dict]: Read and converted reservations (no header row)
@@ -62,52 +88,77 @@ def fetch_reservations(reservation_file: str) -> list[dict]:
     with open(reservation_file, "r", encoding="utf-8") as f:
         for line in f:
             if len(line) > 1:
-                fields = line.split("|")
-                reservations.append(convert_reservation(fields))
+                reservations.append(convert_reservation(line.split("|"), fields))
     return reservations
 
-def confirmed_reservations(reservations: list[dict]) -> None:
+def iter_reservations(reservation_file: str, fields=None) -> Iterator[dict]:
+    """
+    Reads reservations from a file lazily, one dictionary at a time.
+
+    Parameters:
+     reservation_file (str): Name of the file containing the reservations
+     fields (frozenset | None): Only convert these keys, None for all
+
+    Yields:
+     dict: Next converted reservation
+    """
+    with open(reservation_file, "r", encoding="utf-8") as f:
+        for line in f:
+            if len(line) > 1:
+                yield convert_reservation(line.split("|"), fields)
+
+@requires("confirmed", "name", "resource", "date", "time")
+def confirmed_reservations(reservations: list[dict], out: ReportWriter | None = None) -> None:
     """
     Print confirmed reservations
 
     Parameters:
      reservations (list[dict]): Reservations
+     out (ReportWriter | None): Buffered output, standard output when None
     """
-    for reservation in reservations:
-        if reservation["confirmed"]:  # If confirmed
-            print(
-                f'- {reservation["name"]}, {reservation["resource"]}, '
-                f'{reservation["date"].strftime("%d.%m.%Y")} at {reservation["time"].strftime("%H.%M")}'
-            )
+    with out or ReportWriter() as writer:
+        for reservation in reservations:
+            if reservation["confirmed"]:  # If confirmed
+                writer.line(
+                    f'- {reservation["name"]}, {reservation["resource"]}, '
+                    f'{format_day(reservation["date"])} at {format_time(reservation["time"])}'
+                )
 
-def long_reservations(reservations : list[dict]) -> None:
+@requires("duration", "name", "date", "time", "resource")
+def long_reservations(reservations : list[dict], out: ReportWriter | None = None) -> None:
     """
     Print long reservations
 
     Parameters:
      reservations (list[dict]): Reservations
+     out (ReportWriter | None): Buffered output, standard output when None
     """
-    for reservation in reservations:
-        if reservation["duration"] > 3:  # If long
-            print(
-                f'- {reservation["name"]}, {reservation["date"].strftime("%d.%m.%Y")} at '
-                f'{reservation["time"].strftime("%H.%M")}, duration {reservation["duration"]} h, {reservation["resource"]}'
-            )
+    with out or ReportWriter() as writer:
+        for reservation in reservations:
+            if reservation["duration"] > 3:  # If long
+                writer.line(
+                    f'- {reservation["name"]}, {format_day(reservation["date"])} at '
+                    f'{format_time(reservation["time"])}, duration {reservation["duration"]} h, {reservation["resource"]}'
+                )
 
 
-def confirmation_statuses(reservations: list[dict]) -> None:
+@requires("name", "confirmed")
+def confirmation_statuses(reservations: list[dict], out: ReportWriter | None = None) -> None:
     """
     Print confirmation statuses
 
     Parameters:
      reservations (list[dict]): Reservations
+     out (ReportWriter | None): Buffered output, standard output when None
     """
-    for reservation in reservations:
-        name: str = reservation["name"]
-        confirmed: bool = reservation["confirmed"]
+    with out or ReportWriter() as writer:
+        for reservation in reservations:
+            name: str = reservation["name"]
+            confirmed: bool = reservation["confirmed"]
 
-        print(f'{name} → {"Confirmed" if confirmed else "NOT Confirmed"}')
+            writer.line(f'{name} → {"Confirmed" if confirmed else "NOT Confirmed"}')
 
+@requires("confirmed")
 def confirmation_summary(reservations: list[dict]) -> None:
     """
     Print confirmation summary
@@ -121,6 +172,7 @@ def confirmation_summary(reservations: list[dict]) -> None:
         f'- Not confirmed reservations: {len(reservations) - confirmed} pcs'
     )
 
+@requires("duration", "price", "confirmed")
 def total_revenue(reservations: list[dict]) -> None:
     """
     Print total revenue
@@ -133,22 +185,86 @@ def total_revenue(reservations: list[dict]) -> None:
     )
     print(f'Total revenue from confirmed reservations: {revenue:.2f} €'.replace('.', ','))
 
-def main():
+# Report functions in section order; section n is REPORTS[n - 1]
+REPORTS = [
+    confirmed_reservations,
+    long_reservations,
+    confirmation_statuses,
+    confirmation_summary,
+    total_revenue,
+]
+
+def report_sections(selected: tuple = (1, 2, 3, 4, 5)) -> list:
+    """
+    The report sections as single-pass accumulators, producing the
+    same output as the report functions above.
+
+    Parameters:
+     selected (tuple): Section numbers to include, in output order
+
+    Returns:
+     (list): Sections for report_engine.evaluate
+    """
+    sections = [
+        ListSection(
+            "1) Confirmed Reservations",
+            lambda r: r["confirmed"],
+            lambda r: (
+                f'- {r["name"]}, {r["resource"]}, '
+                f'{format_day(r["date"])} at {format_time(r["time"])}'
+            ),
+        ),
+        ListSection(
+            "2) Long Reservations (≥ 3 h)",
+            lambda r: r["duration"] > 3,
+            lambda r: (
+                f'- {r["name"]}, {format_day(r["date"])} at '
+                f'{format_time(r["time"])}, duration {r["duration"]} h, {r["resource"]}'
+            ),
+        ),
+        ListSection(
+            "3) Reservation Confirmation Status",
+            lambda r: True,
+            lambda r: f'{r["name"]} → {"Confirmed" if r["confirmed"] else "NOT Confirmed"}',
+        ),
+        CountSection(
+            "4) Confirmation Summary",
+            lambda r: r["confirmed"],
+            lambda confirmed, not_confirmed: (
+                f'- Confirmed reservations: {confirmed} pcs\n'
+                f'- Not confirmed reservations: {not_confirmed} pcs'
+            ),
+        ),
+        TotalSection(
+            "5) Total Revenue from Confirmed Reservations",
+            lambda r: r["duration"] * r["price"] if r["confirmed"] else 0,
+            lambda total: f'Total revenue from confirmed reservations: {total:.2f} €'.replace('.', ','),
+        ),
+    ]
+    return [sections[number - 1] for number in selected]
+
+def stream_report(reservation_file: str, selected: tuple = (2, 4, 5)) -> None:
+    """
+    Prints the selected report sections straight from the file without
+    loading all reservations. The default long reservations, summary
+    and revenue sections run in constant memory. Only the keys the
+    selected reports need are converted.
+
+    Parameters:
+     reservation_file (str): Name of the file containing the reservations
+     selected (tuple): Section numbers to include, in output order
+    """
+    fields = fields_for(*(REPORTS[number - 1] for number in selected))
+    with ReportWriter() as out:
+        stream_sections(iter_reservations(reservation_file, fields), report_sections(selected), out.line)
+
+def main(argv: list[str] | None = None):
     """
     Prints reservation information according to requirements
-    Reservation-specific printing is done in functions
-    """
-    reservations = fetch_reservations("reservations.txt")
-    print("1) Confirmed Reservations")
-    confirmed_reservations(reservations)
-    print("2) Long Reservations (≥ 3 h)")
-    long_reservations(reservations)
-    print("3) Reservation Confirmation Status")
-    confirmation_statuses(reservations)
-    print("4) Confirmation Summary")
-    confirmation_summary(reservations)
-    print("5) Total Revenue from Confirmed Reservations")
-    total_revenue(reservations)
+    All report sections are filled in one pass over the reservations
+    The command line options are described in report_cli
+    """
+    run(parse_arguments(argv), fetch_reservations, iter_reservations, report_sections, REPORTS, lambda r: r["date"])
 
 if __name__ == "__main__":
     main()
\ No newline at end of file